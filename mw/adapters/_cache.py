@@ -0,0 +1,107 @@
+"""On-disk response cache for the Polygon adapters.
+
+Historical aggregate and quote windows never change once closed, so
+re-running a backfill or backtest can skip the HTTP round-trip entirely.
+Cached frames live as Parquet files under ``$MW_CACHE_DIR``; caching is
+opt-in — when the variable is unset the adapters go straight to the API.
+
+Exports:
+- FileCache(root) with ``get(key, max_age)`` / ``put(key, df)``
+- cache_key(*parts) -> str
+- ttl_for(end, unit) -> float | None
+- default_cache() -> FileCache | None
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from mw.utils.persistence import write_parquet
+
+# Windows that touch today may still gain bars; refresh them hourly.
+_TTL_RECENT = 3600.0
+
+
+def cache_key(*parts: object) -> str:
+    """Deterministic key for a request, hashed from its parameters."""
+
+    return hashlib.md5(
+        "|".join(str(p) for p in parts).encode()
+    ).hexdigest()
+
+
+def ttl_for(end: str | int, unit: str = "ms") -> Optional[float]:
+    """Time-to-live for a request window ending at ``end``.
+
+    Closed historical windows cache forever (``None``); windows whose end
+    falls on or after today's UTC midnight expire after an hour.  ``unit``
+    applies when ``end`` is an epoch value, whether numeric or a numeric
+    string — ``pd.Timestamp`` ignores ``unit`` for strings, so stringified
+    epochs are coerced through ``int()`` first.
+    """
+
+    if isinstance(end, str):
+        try:
+            end = int(end)
+        except ValueError:
+            pass
+    if isinstance(end, (int, float)):
+        end_ts = pd.Timestamp(int(end), unit=unit, tz="UTC")
+    else:
+        end_ts = pd.Timestamp(end, tz="UTC")
+    if end_ts >= pd.Timestamp.now(tz="UTC").normalize():
+        return _TTL_RECENT
+    return None
+
+
+class FileCache:
+    """Parquet-per-key cache directory.
+
+    Freshness is judged from the cache file's mtime, so no sidecar
+    metadata is needed; :func:`mw.utils.persistence.write_parquet` makes
+    each ``put`` atomic.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root).expanduser()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.parquet"
+
+    def get(
+        self, key: str, max_age: Optional[float] = None
+    ) -> Optional[pd.DataFrame]:
+        """Return the cached frame for ``key``, or ``None`` on miss.
+
+        A ``max_age`` in seconds turns stale entries into misses; ``None``
+        means entries never expire.
+        """
+
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if max_age is not None and time.time() - stat.st_mtime > max_age:
+            return None
+        return pd.read_parquet(path)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store ``df`` under ``key`` atomically."""
+
+        write_parquet(df, str(self._path(key)))
+
+
+def default_cache() -> Optional[FileCache]:
+    """Cache rooted at ``$MW_CACHE_DIR``, or ``None`` when caching is off."""
+
+    root = os.getenv("MW_CACHE_DIR")
+    if not root:
+        return None
+    return FileCache(root)
@@ -4,10 +4,23 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
 import pandas as pd
 import requests
 
-from .polygon_rest import BASE_URL, _get_api_key, _request_with_retry
+from . import _cache
+from .polygon_rest import (
+    BASE_URL,
+    _as_utc_index,
+    _canonical,
+    _get_api_key,
+    _parse_json,
+    _request_with_retry,
+)
+
+# Bound ``str.format`` method, mirroring ``_AGG_URL`` in polygon_rest: the
+# template is parsed once at import rather than per fetch.
+_QUOTES_URL = (BASE_URL + "/v3/quotes/{t}").format
 
 
 def fetch_quotes(
@@ -33,8 +46,15 @@ def fetch_quotes(
         ``venue`` (if available).
     """
 
+    cache = _cache.default_cache()
+    if cache is not None:
+        key = _cache.cache_key("quotes", ticker, start, end, limit)
+        cached = cache.get(key, max_age=_cache.ttl_for(end, unit="ns"))
+        if cached is not None:
+            return _canonical(cached)
+
     api_key = _get_api_key()
-    url = f"{BASE_URL}/v3/quotes/{ticker}"
+    url = _QUOTES_URL(t=ticker)
     params = {
         "timestamp.gte": start,
         "timestamp.lte": end,
@@ -43,18 +63,61 @@ def fetch_quotes(
         "order": "asc",
         "apiKey": api_key,
     }
-    all_results: List[dict] = []
+    # Collect typed per-page arrays so the list-of-dicts never exists in
+    # aggregate form; each page's dicts become garbage as soon as its columns
+    # are extracted.
+    ts_pages: List[np.ndarray] = []
+    bid_pages: List[np.ndarray] = []
+    ask_pages: List[np.ndarray] = []
+    venue_pages: List[list] = []
     while url:
         try:
             resp = _request_with_retry(
                 url, params=params if params is not None else None
             )
         except requests.RequestException as exc:  # pragma: no cover - safety
-            raise RuntimeError("Polygon API request failed") from exc
+            raise RuntimeError(
+                f"Polygon API request failed after 3 attempts: {exc}"
+            ) from exc
 
-        data = resp.json()
+        data = _parse_json(resp)
         results = data.get("results", [])
-        all_results.extend(results)
+        if results:
+            n = len(results)
+            ts_pages.append(
+                np.fromiter(
+                    (
+                        r.get("sip_timestamp", r.get("timestamp"))
+                        for r in results
+                    ),
+                    dtype=np.int64,
+                    count=n,
+                )
+            )
+            bid_pages.append(
+                np.fromiter(
+                    (r["bid_price"] for r in results),
+                    dtype=np.float64,
+                    count=n,
+                )
+            )
+            ask_pages.append(
+                np.fromiter(
+                    (r["ask_price"] for r in results),
+                    dtype=np.float64,
+                    count=n,
+                )
+            )
+            venue_col = None
+            for col in ("participant_exchange", "exchange", "x"):
+                if any(col in r for r in results):
+                    venue_col = col
+                    break
+            if venue_col is not None:
+                venue_pages.append([r.get(venue_col) for r in results])
+            else:
+                venue_pages.append([None] * n)
+
         next_url = data.get("next_url")
         if next_url:
             if "apiKey" not in next_url:
@@ -64,26 +127,34 @@ def fetch_quotes(
         else:
             url = None
 
-    if not all_results:
-        return pd.DataFrame(columns=["ts_utc", "bid", "ask", "mid", "venue"])
-
-    df = pd.DataFrame(all_results)
-    if "sip_timestamp" in df.columns:
-        df["ts_utc"] = pd.to_datetime(df["sip_timestamp"], unit="ns", utc=True)
-    else:
-        df["ts_utc"] = pd.to_datetime(df["timestamp"], unit="ns", utc=True)
-    df["bid"] = df["bid_price"]
-    df["ask"] = df["ask_price"]
-    df["mid"] = (df["bid"] + df["ask"]) / 2
-
-    venue_col = None
-    for col in ("participant_exchange", "exchange", "x"):
-        if col in df.columns:
-            venue_col = col
-            break
-    if venue_col is not None:
-        df["venue"] = df[venue_col]
-    else:
-        df["venue"] = pd.NA
-    df.attrs["source_time_basis"] = "UTC"
-    return df[["ts_utc", "bid", "ask", "mid", "venue"]]
+    if not ts_pages:
+        return _canonical(
+            pd.DataFrame(columns=["ts_utc", "bid", "ask", "mid", "venue"])
+        )
+
+    ts = np.concatenate(ts_pages)
+    bid = np.concatenate(bid_pages)
+    ask = np.concatenate(ask_pages)
+    # Venue cardinality is tiny (~30 exchanges), so a categorical stores
+    # small integer codes plus one categories array instead of per-row
+    # Python strings. Pages without a venue column contribute NaN codes.
+    venue = pd.Categorical(v for page in venue_pages for v in page)
+
+    # Fused mid computation: one output buffer, no intermediate sum/half
+    # arrays, and the ufuncs run at SIMD width over the float64 columns.
+    mid = np.empty_like(bid)
+    np.add(bid, ask, out=mid)
+    mid *= 0.5
+
+    df = pd.DataFrame(
+        {
+            "ts_utc": _as_utc_index(ts),
+            "bid": bid,
+            "ask": ask,
+            "mid": mid,
+            "venue": venue,
+        }
+    )
+    if cache is not None:
+        cache.put(key, df)
+    return _canonical(df)
@@ -5,32 +5,118 @@ from __future__ import annotations
 import os
 import random
 import time
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Iterator
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
 
+from mw.adapters import _cache
+
 BASE_URL = "https://api.polygon.io"
 
+# Bound ``str.format`` method: the template string is parsed once at import
+# instead of per call, which matters in backfill loops issuing thousands of
+# requests.
+_AGG_URL = (BASE_URL + "/v2/aggs/ticker/C:{s}/range/1/minute/{a}/{b}").format
+
 _SESSION: requests.Session | None = None
 _REQUESTS_GET = requests.get
+_API_KEY: str | None = None
 
 
 def _get_session() -> requests.Session:
-    """Return a global ``requests.Session`` instance."""
+    """Return a global ``requests.Session`` with a tuned connection pool.
+
+    All Polygon calls hit the same host, so a larger keep-alive pool
+    amortizes TCP/TLS handshakes across sequential and threaded requests.
+    Retries stay in :func:`_request_with_retry`, not the adapter.
+    """
     global _SESSION
     if _SESSION is None:
         _SESSION = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=0
+        )
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+        # Advertise brotli only when urllib3 can actually decode it;
+        # otherwise Polygon would send br bytes requests cannot inflate.
+        try:
+            import brotli  # noqa: F401
+
+            accept = "gzip, br"
+        except ImportError:  # pragma: no cover - depends on environment
+            accept = "gzip"
+        _SESSION.headers.update(
+            {"Accept-Encoding": accept, "User-Agent": "mw/0.1"}
+        )
     return _SESSION
 
 
 def _get_api_key() -> str:
-    """Return the Polygon API key from the environment."""
-    api_key = os.getenv("POLYGON_API_KEY")
-    if not api_key:
-        raise RuntimeError("POLYGON_API_KEY not set")
-    return api_key
+    """Return the Polygon API key, reading the environment once.
+
+    The key is cached at module level after the first successful lookup so
+    backfill loops do not re-query the environment per request.  A 401 from
+    Polygon clears the cache (see :func:`_request_with_retry`) so a rotated
+    key is picked up on the next call.
+    """
+    global _API_KEY
+    if _API_KEY is None:
+        api_key = os.getenv("POLYGON_API_KEY")
+        if not api_key:
+            raise RuntimeError("POLYGON_API_KEY not set")
+        _API_KEY = api_key
+    return _API_KEY
+
+
+def _canonical(df: pd.DataFrame) -> pd.DataFrame:
+    """Tag ``df`` with the adapter time basis so downstream code need not
+    re-infer it from the timestamps."""
+    df.attrs["source_time_basis"] = "UTC"
+    return df
+
+
+def _as_utc_index(epochs: np.ndarray, unit: str = "ns") -> pd.DatetimeIndex:
+    """Return a UTC ``DatetimeIndex`` from int64 epoch values in ``unit``.
+
+    The ``view`` is zero-copy and skips the dtype inference of
+    ``pd.to_datetime`` on a Series.
+    """
+    return pd.DatetimeIndex(epochs.view(f"datetime64[{unit}]"), tz="UTC")
+
+
+def _parse_json(resp: requests.Response) -> dict:
+    """Decode a Polygon JSON response.
+
+    Prefers ``orjson`` on the raw bytes (C-level parsing, no intermediate
+    Python string) and falls back to ``resp.json()`` for response objects
+    that do not expose ``content``.
+    """
+    content = getattr(resp, "content", None)
+    if content is not None:
+        return orjson.loads(content)
+    return resp.json()
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header as seconds or an RFC 1123 date."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):  # pragma: no cover - safety
+            return None
+        delta = when - datetime.now(timezone.utc)
+        return max(0.0, delta.total_seconds())
 
 
 def _request_with_retry(
@@ -39,34 +125,37 @@ def _request_with_retry(
     *,
     timeout: int = 10,
     max_attempts: int = 3,
+    max_delay: float = 30.0,
 ) -> requests.Response:
     """Make a GET request with retry logic.
 
-    Retries on HTTP 429 and 5xx responses using a jittered exponential
-    backoff.  If the response includes a ``Retry-After`` header it is used
-    verbatim for the sleep interval.
+    Retries on HTTP 429 and 5xx responses without raising until attempts are
+    exhausted.  A ``Retry-After`` header (either seconds or an HTTP date) is
+    honoured when present; otherwise a decorrelated-jitter backoff is used.
+    Every sleep is clamped to ``max_delay`` seconds.
     """
 
     session = _get_session()
     get_call = session.get if requests.get is _REQUESTS_GET else requests.get
 
+    prev_sleep = 1.0
     for attempt in range(max_attempts):
         resp = get_call(url, params=params, timeout=timeout)
         if resp.status_code == 429 or resp.status_code >= 500:
             if attempt == max_attempts - 1:
                 resp.raise_for_status()
-            retry_after = resp.headers.get("Retry-After")
-            if retry_after is not None:
-                try:
-                    sleep_time = float(retry_after)
-                except ValueError:  # pragma: no cover - safety
-                    sleep_time = 0
-                if sleep_time <= 0:
-                    sleep_time = (2**attempt) + random.uniform(0, 1)
-            else:
-                sleep_time = (2**attempt) + random.uniform(0, 1)
+            sleep_time = _retry_after_seconds(resp.headers.get("Retry-After"))
+            if sleep_time is None or sleep_time <= 0:
+                sleep_time = random.uniform(1.0, prev_sleep * 3)
+            sleep_time = min(max_delay, sleep_time)
+            prev_sleep = sleep_time
             time.sleep(sleep_time)
             continue
+        if resp.status_code == 401:
+            # Drop the cached key so a rotated credential is re-read from
+            # the environment on the next call.
+            global _API_KEY
+            _API_KEY = None
         resp.raise_for_status()
         return resp
 
@@ -96,8 +185,15 @@ def fetch_fx_agg_minute(
         ``close`` and ``volume``.  ``timestamp`` is timezone aware (UTC).
     """
 
+    cache = _cache.default_cache()
+    if cache is not None:
+        key = _cache.cache_key("fx_agg_minute", symbol, start, end, limit)
+        cached = cache.get(key, max_age=_cache.ttl_for(end, unit="ms"))
+        if cached is not None:
+            return _canonical(cached)
+
     api_key = _get_api_key()
-    url = f"{BASE_URL}/v2/aggs/ticker/C:{symbol}/range/1/minute/{start}/{end}"
+    url = _AGG_URL(s=symbol, a=start, b=end)
     params = {
         "adjusted": "true",
         "sort": "asc",
@@ -111,38 +207,69 @@ def fetch_fx_agg_minute(
             f"Polygon API request failed after 3 attempts: {exc}"
         ) from exc
     try:
-        data = resp.json()
+        data = _parse_json(resp)
     except ValueError as exc:
         raise RuntimeError("Polygon API returned invalid JSON") from exc
     results = data.get("results", [])
     if not results:
-        return pd.DataFrame(
-            columns=["timestamp", "open", "high", "low", "close", "volume"]
+        return _canonical(
+            pd.DataFrame(
+                columns=[
+                    "timestamp",
+                    "open",
+                    "high",
+                    "low",
+                    "close",
+                    "volume",
+                ]
+            )
         )
-    df = pd.DataFrame(results)
-    df = df.rename(
-        columns={
-            "t": "timestamp",
-            "o": "open",
-            "h": "high",
-            "l": "low",
-            "c": "close",
-            "v": "volume",
+    # Pull each field into a typed array directly: building a DataFrame
+    # from the list of result dicts would hash every key per row and run
+    # type inference per column, only to rename and reorder afterwards.
+    n = len(results)
+    ms = np.fromiter((r["t"] for r in results), dtype=np.int64, count=n)
+    df = pd.DataFrame(
+        {
+            "timestamp": _as_utc_index(ms, unit="ms"),
+            "open": np.fromiter(
+                (r["o"] for r in results), dtype=np.float64, count=n
+            ),
+            "high": np.fromiter(
+                (r["h"] for r in results), dtype=np.float64, count=n
+            ),
+            "low": np.fromiter(
+                (r["l"] for r in results), dtype=np.float64, count=n
+            ),
+            "close": np.fromiter(
+                (r["c"] for r in results), dtype=np.float64, count=n
+            ),
+            # Volume is integral for FX aggregates but can arrive as a
+            # float; let numpy pick the dtype from the payload.
+            "volume": np.asarray([r["v"] for r in results]),
         }
     )
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-    df.attrs["source_time_basis"] = "UTC"
-    return df[["timestamp", "open", "high", "low", "close", "volume"]]
+    if cache is not None:
+        cache.put(key, df)
+    return _canonical(df)
 
 
 def backfill_fx_agg_minute(
-    symbol: str, start: str, end: str, chunk_days: int = 3
+    symbol: str,
+    start: str,
+    end: str,
+    chunk_days: int = 3,
+    max_workers: int = 8,
 ) -> Iterator[pd.DataFrame]:
     """Yield minute aggregates for ``symbol`` over a date range.
 
     The date range ``start`` → ``end`` (inclusive) is split into chunks of
-    ``chunk_days`` each.  Each yielded dataframe contains canonical columns as
-    described by :func:`fetch_fx_agg_minute`.
+    ``chunk_days`` each.  Chunks are fetched concurrently over the pooled
+    session with at most ``max_workers`` threads, but frames are yielded in
+    chronological (submission) order.  Each yielded dataframe contains
+    canonical columns as described by :func:`fetch_fx_agg_minute`.
+    Concurrency is bounded to stay under Polygon's rate limits; 429s are
+    absorbed by :func:`_request_with_retry`.
     """
 
     start_dt = pd.to_datetime(start).tz_localize("UTC")
@@ -150,13 +277,25 @@ def backfill_fx_agg_minute(
     current = start_dt
     delta = timedelta(days=chunk_days - 1)
 
+    chunks = []
     while current <= end_dt:
         chunk_end = min(current + delta, end_dt)
-        df = fetch_fx_agg_minute(
-            symbol,
-            current.strftime("%Y-%m-%d"),
-            chunk_end.strftime("%Y-%m-%d"),
-        )
-        if not df.empty:
-            yield df
+        chunks.append((current, chunk_end))
         current = chunk_end + timedelta(days=1)
+    if not chunks:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+        futures = [
+            pool.submit(
+                fetch_fx_agg_minute,
+                symbol,
+                chunk_start.strftime("%Y-%m-%d"),
+                chunk_end.strftime("%Y-%m-%d"),
+            )
+            for chunk_start, chunk_end in chunks
+        ]
+        for future in futures:
+            df = future.result()
+            if not df.empty:
+                yield df
@@ -6,14 +6,16 @@ Exports:
     series: pd.Series, window: int, m=3, tau=1
   ) -> pd.Series
 - sample_entropy(series: pd.Series, m=2, r=0.2) -> float
+- rolling_sample_entropy(
+    series: pd.Series, window: int, m=2, r=0.2, global_sigma=False
+  ) -> pd.Series
 """
 
-from collections import Counter
 from math import factorial, log
-from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from scipy.spatial import cKDTree
 
 
@@ -24,41 +26,64 @@ def _ordinal_patterns(
     values: np.ndarray,
     m: int,
     tau: int,
-) -> List[Tuple[int, ...]]:
-    """Return ordinal patterns for ``values``."""
+) -> np.ndarray:
+    """Return ordinal pattern ids for ``values``.
+
+    Every length-``m`` window (with delay ``tau``) is ranked in a single
+    vectorized pass and encoded as a Lehmer code, i.e. an integer in
+    ``[0, m!)``, so callers can tally patterns with a dense
+    :func:`numpy.bincount` of length ``factorial(m)``.
+    """
     n = len(values)
-    if n < (m - 1) * tau + 1:
-        return []
-
-    patterns: List[Tuple[int, ...]] = []
-    for i in range(n - (m - 1) * tau):
-        window = values[i : i + (m - 1) * tau + 1 : tau]  # noqa: E203
-        if np.unique(window).size == 1:
-            inner = np.argsort(window, kind="mergesort")
-        else:
-            if np.unique(window).size < window.size:
-                jitter = _rng.uniform(-1e-10, 1e-10, size=window.size)
-                window = window + jitter
-            inner = np.argsort(window, kind="mergesort")
-        ranks = np.argsort(inner, kind="mergesort")
-        patterns.append(tuple(ranks))
-    return patterns
+    span = (m - 1) * tau + 1
+    if n < span:
+        return np.empty(0, dtype=np.int64)
+
+    windows = sliding_window_view(values, span)[:, ::tau].astype(float)
+    # Mirror the scalar tie handling: fully constant windows keep the identity
+    # pattern while partially tied windows are jittered to break ties.
+    sorted_rows = np.sort(windows, axis=1)
+    has_tie = (sorted_rows[:, 1:] == sorted_rows[:, :-1]).any(axis=1)
+    constant = (windows == windows[:, :1]).all(axis=1)
+    jitter_rows = has_tie & ~constant
+    if jitter_rows.any():
+        windows = windows.copy()
+        windows[jitter_rows] += _rng.uniform(
+            -1e-10, 1e-10, size=(int(jitter_rows.sum()), m)
+        )
+    order = windows.argsort(axis=1, kind="stable")
+    ranks = order.argsort(axis=1, kind="stable")
+
+    ids = np.zeros(ranks.shape[0], dtype=np.int64)
+    for j in range(m):
+        digit = ranks[:, j] - (ranks[:, :j] < ranks[:, j : j + 1]).sum(axis=1)
+        ids += digit * factorial(m - 1 - j)
+    return ids
+
+
+def _permutation_entropy_arr(values: np.ndarray, m: int, tau: int) -> float:
+    """Permutation entropy of a clean float array.
+
+    Array-level kernel behind :func:`permutation_entropy`; callers that
+    already hold a NaN-free ndarray can skip the Series wrapping and
+    ``dropna`` scan entirely.
+    """
+    ids = _ordinal_patterns(values, m, tau)
+    if ids.size == 0:
+        return float("nan")
+
+    counts = np.bincount(ids, minlength=factorial(m))
+    probs = counts[counts > 0] / ids.size
+    entropy = -np.sum(probs * np.log(probs))
+    return float(entropy / log(factorial(m)))
 
 
 def permutation_entropy(series: pd.Series, m: int = 3, tau: int = 1) -> float:
     """Return normalized permutation entropy in [0,1] for the last window of
     ``series``.
     """
-    values = series.dropna().to_numpy()
-    patterns = _ordinal_patterns(values, m, tau)
-    if not patterns:
-        return float("nan")
-
-    counts = Counter(patterns)
-    probs = np.fromiter(counts.values(), dtype=float)
-    probs /= probs.sum()
-    entropy = -np.sum(probs * np.log(probs))
-    return float(entropy / log(factorial(m)))
+    values = series.dropna().to_numpy(dtype=np.float64)
+    return _permutation_entropy_arr(values, m, tau)
 
 
 def rolling_permutation_entropy(
@@ -73,20 +98,84 @@ def rolling_permutation_entropy(
     length and index of ``series``.
     """
 
-    values = np.full(len(series), np.nan, dtype=float)
     if window <= 0:
         raise ValueError("window must be positive")
 
-    for i in range(window - 1, len(series)):
-        window_slice = series.iloc[i - window + 1 : i + 1]
-        # Require a full window of observations; mimic pandas' ``min_periods``.
-        if window_slice.isna().any():
-            continue
-        values[i] = permutation_entropy(window_slice, m=m, tau=tau)
+    n = len(series)
+    values = np.full(n, np.nan, dtype=float)
+    span = (m - 1) * tau + 1
+    npat = window - span + 1
+    if n < window or npat <= 0:
+        return pd.Series(values, index=series.index)
+
+    raw = series.to_numpy(dtype=float)
+    # Require a full window of observations; mimic pandas' ``min_periods``.
+    csum = np.concatenate(([0], np.cumsum(~np.isnan(raw))))
+    full = (csum[window:] - csum[:-window]) == window
+
+    # Pattern ids are computed once per position; consecutive windows then
+    # differ by a single pattern at each end, so the histogram is updated in
+    # O(1) per step instead of re-ranking every window.
+    ids = _ordinal_patterns(raw, m, tau)
+    nbins = factorial(m)
+    denom = log(nbins)
+    hist = np.zeros(nbins, dtype=np.int64)
+    for pid in ids[:npat]:
+        hist[pid] += 1
+
+    start = window - 1
+    for t in range(start, n):
+        if t > start:
+            hist[ids[t - span + 1]] += 1
+            hist[ids[t - window]] -= 1
+        if full[t - start]:
+            probs = hist[hist > 0] / npat
+            values[t] = -np.sum(probs * np.log(probs)) / denom
 
     return pd.Series(values, index=series.index)
 
 
+def _robust_tol(x: np.ndarray, r: float) -> float:
+    """Return ``r * sigma`` with sigma from the median absolute deviation."""
+    med = np.median(x)
+    mad = np.median(np.abs(x - med))
+    return r * mad * 1.4826
+
+
+def _match_fraction(embed: np.ndarray, tol: float, theiler: int) -> float:
+    """Fraction of Theiler-admissible vector pairs within Chebyshev ``tol``."""
+    n_vec = embed.shape[0]
+    if n_vec <= theiler + 1:
+        return float("nan")
+
+    tree = cKDTree(embed, balanced_tree=False, compact_nodes=False)
+    # Ordered pairs within Chebyshev distance ``tol``, self-pairs included;
+    # count_neighbors never materializes the pair set.
+    close = tree.count_neighbors(tree, tol, p=np.inf)
+    matches = int(close - n_vec) // 2
+    # Subtract the pairs inside the Theiler band that are also within
+    # ``tol``; the band holds only n_vec*theiler candidates, so a direct
+    # vectorized distance check is cheap and keeps the count exact.
+    for k in range(1, theiler + 1):
+        band = np.abs(embed[k:] - embed[:-k]).max(axis=1)
+        matches -= int(np.count_nonzero(band <= tol))
+    total = ((n_vec - theiler - 1) * (n_vec - theiler)) // 2
+    if total == 0:
+        return float("nan")
+    return matches / total
+
+
+def _sampen_from_embeddings(
+    emb_m: np.ndarray, emb_m1: np.ndarray, tol: float, theiler: int
+) -> float:
+    """Sample entropy from prebuilt m- and (m+1)-dimensional embeddings."""
+    b = _match_fraction(emb_m, tol, theiler)
+    a = _match_fraction(emb_m1, tol, theiler)
+    if np.isnan(a) or np.isnan(b) or a == 0 or b == 0:
+        return float("nan")
+    return float(-np.log(a / b))
+
+
 def sample_entropy(series: pd.Series, m: int = 2, r: float = 0.2) -> float:
     """Return Sample Entropy for the last window of `series`.
 
@@ -97,35 +186,66 @@ def sample_entropy(series: pd.Series, m: int = 2, r: float = 0.2) -> float:
     if n <= m + 1:
         return float("nan")
 
-    # Robust sigma via median absolute deviation
-    med = np.median(x)
-    mad = np.median(np.abs(x - med))
-    sigma = mad * 1.4826
-    tol = r * sigma
+    tol = _robust_tol(x, r)
 
     # Build template vectors of length m and m+1
     emb_m = np.column_stack([x[i : n - m + i + 1] for i in range(m)])
     emb_m1 = np.column_stack([x[i : n - m + i] for i in range(m + 1)])
 
-    theiler = m  # Exclude temporally adjacent vectors
+    # Theiler window of ``m`` excludes temporally adjacent vectors.
+    return _sampen_from_embeddings(emb_m, emb_m1, tol, theiler=m)
 
-    def _match_fraction(embed: np.ndarray) -> float:
-        n_vec = embed.shape[0]
-        if n_vec <= theiler + 1:
-            return float("nan")
 
-        tree = cKDTree(embed)
-        # Pairs within Chebyshev distance ``tol``
-        pairs = tree.query_pairs(tol, p=np.inf)
-        matches = sum(1 for i, j in pairs if j - i > theiler)
-        total = ((n_vec - theiler - 1) * (n_vec - theiler)) // 2
-        if total == 0:
-            return float("nan")
-        return matches / total
+def rolling_sample_entropy(
+    series: pd.Series,
+    window: int,
+    m: int = 2,
+    r: float = 0.2,
+    global_sigma: bool = False,
+) -> pd.Series:
+    """Return Sample Entropy over causal sliding windows.
+
+    The result is aligned to the window end like
+    :func:`rolling_permutation_entropy`; positions without a full window of
+    observations are ``NaN``. Both embeddings are built once for the whole
+    series with :func:`numpy.lib.stride_tricks.sliding_window_view` and each
+    window merely slices rows from them.
+
+    Parameters
+    ----------
+    series, window, m, r
+        As in :func:`sample_entropy`.
+    global_sigma
+        When ``True``, the MAD-based tolerance is computed once over the full
+        series and reused for every window instead of being refit per window.
+    """
 
-    b = _match_fraction(emb_m)
-    a = _match_fraction(emb_m1)
-    if np.isnan(a) or np.isnan(b) or a == 0 or b == 0:
-        return float("nan")
+    if window <= 0:
+        raise ValueError("window must be positive")
 
-    return float(-np.log(a / b))
+    n = len(series)
+    out = np.full(n, np.nan)
+    if n < window or window <= m + 1:
+        return pd.Series(out, index=series.index)
+
+    x = series.to_numpy(dtype=float)
+    csum = np.concatenate(([0], np.cumsum(~np.isnan(x))))
+    full = (csum[window:] - csum[:-window]) == window
+
+    emb_m_all = sliding_window_view(x, m)
+    emb_m1_all = sliding_window_view(x, m + 1)
+    tol_global = _robust_tol(x[~np.isnan(x)], r) if global_sigma else None
+
+    for end in range(window - 1, n):
+        start = end - window + 1
+        if not full[start]:
+            continue
+        if tol_global is None:
+            tol = _robust_tol(x[start : end + 1], r)  # noqa: E203
+        else:
+            tol = tol_global
+        emb_m = emb_m_all[start : end - m + 2]
+        emb_m1 = emb_m1_all[start : end - m + 1]
+        out[end] = _sampen_from_embeddings(emb_m, emb_m1, tol, theiler=m)
+
+    return pd.Series(out, index=series.index)
@@ -18,10 +18,9 @@ Notes
 
 from __future__ import annotations
 
-from typing import Iterable
-
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 
 
 def _delay_embed(x: np.ndarray, m: int, tau: int) -> np.ndarray:
@@ -33,16 +32,37 @@ def _delay_embed(x: np.ndarray, m: int, tau: int) -> np.ndarray:
     return np.column_stack(cols)
 
 
-def _slope(y: Iterable[float]) -> float:
-    """Return slope of least-squares fit of ``y`` vs ``1..len(y)``."""
-    x = np.arange(1, len(y) + 1, dtype=float)
-    y = np.asarray(list(y), dtype=float)
-    x_mean = x.mean()
-    y_mean = y.mean()
-    denom = ((x - x_mean) ** 2).sum()
+def _ftle_core(embed: np.ndarray, horizon: int, theiler: int) -> np.ndarray:
+    """Per-anchor divergence slopes for :func:`ftle_rosenstein`.
+
+    Nearest neighbours are found with a kd-tree (O(n log n) instead of the
+    former O(n^2) scan), querying ``2*theiler + 2`` candidates per anchor so
+    at least one falls outside the Theiler band. The horizon expansion and
+    the least-squares slope fit are computed for all anchors at once.
+    """
+    valid = embed.shape[0] - horizon
+    anchors = embed[:valid]
+
+    tree = cKDTree(anchors)
+    _, idxs = tree.query(anchors, k=min(valid, 2 * theiler + 2), workers=-1)
+
+    i_arr = np.arange(valid)
+    outside = np.abs(idxs - i_arr[:, None]) > theiler
+    # First (= closest) candidate outside the Theiler band; fall back to 0
+    # when none qualifies, matching the old argmin-over-masked behaviour.
+    j_arr = np.where(
+        outside.any(axis=1), idxs[i_arr, outside.argmax(axis=1)], 0
+    )
+
+    k_arr = np.arange(1, horizon + 1)
+    diff = embed[i_arr[:, None] + k_arr] - embed[j_arr[:, None] + k_arr]
+    logs = np.log(np.maximum(np.linalg.norm(diff, axis=2), 1e-8))
+
+    k_centered = k_arr - k_arr.mean()
+    denom = (k_centered**2).sum()
     if denom == 0:
-        return float("nan")
-    return float(((x - x_mean) * (y - y_mean)).sum() / denom)
+        return np.full(valid, np.nan)
+    return (logs * k_centered).sum(axis=1) / denom
 
 
 def ftle_rosenstein(
@@ -70,30 +90,18 @@ def ftle_rosenstein(
         nearest neighbours.
     """
 
-    x = series.dropna().to_numpy()[-window:]
-    embed = _delay_embed(x, m, tau)
-    n_vectors = embed.shape[0]
-    if n_vectors <= horizon + 1:
-        return float("nan")
-
-    valid = n_vectors - horizon
-    anchors = embed[:valid]
-    n = anchors.shape[0]
-    slopes = []
-    eps = 1e-8
+    x = series.dropna().to_numpy(dtype=float)[-window:]
+    return _ftle_from_values(x, m, tau, horizon, theiler)
 
-    for i in range(n):
-        dists = np.linalg.norm(anchors[i] - anchors, axis=1)
-        mask = np.abs(np.arange(n) - i) <= theiler
-        dists[mask] = np.inf
-        j = int(np.argmin(dists))
-        logs = []
-        for k in range(1, horizon + 1):
-            dist = np.linalg.norm(embed[i + k] - embed[j + k])
-            logs.append(np.log(max(dist, eps)))
-        slopes.append(_slope(logs))
 
-    return float(np.nanmedian(slopes))
+def _ftle_from_values(
+    x: np.ndarray, m: int, tau: int, horizon: int, theiler: int
+) -> float:
+    """FTLE of a plain NumPy window; shared by the scalar and rolling paths."""
+    embed = _delay_embed(x, m, tau)
+    if embed.shape[0] <= horizon + 1:
+        return float("nan")
+    return float(np.nanmedian(_ftle_core(embed, horizon, theiler)))
 
 
 def rolling_ftle_rosenstein(
@@ -111,9 +119,23 @@ def rolling_ftle_rosenstein(
     window or the embedding/horizon parameters not providing enough vectors.
     """
 
-    def _apply(x: pd.Series) -> float:
-        return ftle_rosenstein(
-            x, window=len(x), m=m, tau=tau, horizon=horizon, theiler=theiler
-        )
-
-    return series.rolling(window, min_periods=window).apply(_apply, raw=False)
+    arr = series.to_numpy(dtype=float)
+    n = arr.size
+    out = np.full(n, np.nan)
+    if window > 0 and n >= window:
+        # Full-window requirement (pandas' min_periods) via a cumulative sum
+        # of valid observations, checked in O(1) per step.
+        csum = np.concatenate(([0], np.cumsum(~np.isnan(arr))))
+        full = (csum[window:] - csum[:-window]) == window
+        for end in range(window - 1, n):
+            if not full[end - window + 1]:
+                continue
+            out[end] = _ftle_from_values(
+                arr[end - window + 1 : end + 1],  # noqa: E203
+                m,
+                tau,
+                horizon,
+                theiler,
+            )
+
+    return pd.Series(out, index=series.index)
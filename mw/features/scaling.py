@@ -5,16 +5,72 @@ Exports
 - ``minmax_causal(x: pd.Series, win: int) -> pd.Series`` in ``[0, 1]``
 - ``tod_percentile_fit(x: pd.Series) -> dict``
   minute-of-day profiles (offline)
+- ``tod_percentile_index(model: dict, bins: int = 256) -> dict``
+  uniform-grid lookup tables for a frozen model
 - ``tod_percentile_transform(x: pd.Series, model: dict) -> pd.Series`` in
   ``[0, 1]``
+- ``tod_percentile_bands(x: pd.Series, model: dict, qs) -> pd.DataFrame``
+  boolean band membership, one column per threshold
 """
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Sequence
 
 import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _minmax_causal_nb(values: np.ndarray, win: int, eps: float) -> np.ndarray:
+    """Single-pass trailing min-max scaling with monotonic deques.
+
+    Maintains an ascending-minima and a descending-maxima deque over the
+    trailing window, so min and max are both available in amortized O(1)
+    per element and the array is traversed exactly once. NaN inputs are
+    never pushed and always yield NaN outputs, matching pandas' rolling
+    semantics with ``min_periods=1``. Each value is clamped into ``[0, 1]``
+    in the same pass, so no separate clip step (pandas or ``np.clip``) runs
+    over the output.
+    """
+    n = values.size
+    out = np.empty(n, values.dtype)
+    min_dq = np.empty(n, np.int64)
+    max_dq = np.empty(n, np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+
+    for i in range(n):
+        v = values[i]
+        if not np.isnan(v):
+            while min_tail > min_head and values[min_dq[min_tail - 1]] >= v:
+                min_tail -= 1
+            min_dq[min_tail] = i
+            min_tail += 1
+            while max_tail > max_head and values[max_dq[max_tail - 1]] <= v:
+                max_tail -= 1
+            max_dq[max_tail] = i
+            max_tail += 1
+
+        while min_tail > min_head and min_dq[min_head] <= i - win:
+            min_head += 1
+        while max_tail > max_head and max_dq[max_head] <= i - win:
+            max_head += 1
+
+        if np.isnan(v) or min_tail == min_head:
+            out[i] = np.nan
+        else:
+            lo = values[min_dq[min_head]]
+            hi = values[max_dq[max_head]]
+            scaled = (v - lo) / (hi - lo + eps)
+            if scaled < 0.0:
+                scaled = 0.0
+            elif scaled > 1.0:
+                scaled = 1.0
+            out[i] = scaled
+
+    return out
 
 
 def minmax_causal(x: pd.Series, win: int, eps: float = 1e-9) -> pd.Series:
@@ -39,11 +95,11 @@ def minmax_causal(x: pd.Series, win: int, eps: float = 1e-9) -> pd.Series:
     if win <= 0:
         raise ValueError("win must be positive")
 
-    roll = x.rolling(win, min_periods=1)
-    x_min = roll.min()
-    x_max = roll.max()
-    scaled = (x - x_min) / (x_max - x_min + eps)
-    return scaled.clip(0.0, 1.0)
+    # Preserve float32 inputs so downstream passes keep the halved footprint.
+    values = x.to_numpy(copy=False)
+    if values.dtype != np.float32:
+        values = values.astype(np.float64, copy=False)
+    return pd.Series(_minmax_causal_nb(values, win, eps), index=x.index, name=x.name)
 
 
 def tod_percentile_fit(x: pd.Series) -> Dict[int, np.ndarray]:
@@ -65,12 +121,162 @@ def tod_percentile_fit(x: pd.Series) -> Dict[int, np.ndarray]:
     if not isinstance(x.index, pd.DatetimeIndex):
         raise TypeError("x must be indexed by a DatetimeIndex")
 
-    minute_of_day = x.index.hour * 60 + x.index.minute
-    groups = x.groupby(minute_of_day)
-    model = {int(m): g.sort_values().to_numpy() for m, g in groups}
+    # Sort once by minute-of-day and slice the buckets out of the ordered
+    # array, mirroring tod_percentile_transform; this skips pandas' groupby
+    # machinery and its per-group Series wrappers entirely.
+    minute_of_day = (x.index.hour * 60 + x.index.minute).to_numpy()
+    vals = x.to_numpy()
+    order = np.argsort(minute_of_day, kind="stable")
+    sorted_mod = minute_of_day[order]
+    sorted_vals = vals[order]
+    uniq, starts = np.unique(sorted_mod, return_index=True)
+    bounds = np.append(starts, sorted_mod.size)
+    model: Dict[int, np.ndarray] = {}
+    for m, lo, hi in zip(uniq, bounds[:-1], bounds[1:]):
+        arr = sorted_vals[lo:hi]
+        # One vectorized comparison detects already-ordered buckets (common
+        # for slowly varying series) and skips both the sort and its copy.
+        if arr.size > 1 and not np.all(arr[1:] >= arr[:-1]):
+            arr = np.sort(arr, kind="stable")
+        model[int(m)] = arr
     return model
 
 
+@njit(cache=True)
+def _indexed_ranks_nb(
+    arr: np.ndarray,
+    edges: np.ndarray,
+    x_min: float,
+    inv_dx: float,
+    vals: np.ndarray,
+) -> np.ndarray:
+    """Exact right-side ranks of ``vals`` in sorted ``arr`` via a bin table.
+
+    ``edges[k]`` holds the rank of the ``k``-th uniform bin's left edge, so a
+    query reduces to one multiply, a gather and a short scan bounded by the
+    bin occupancy — amortized O(1) when the table has ~len(arr) bins.
+    """
+    n_arr = arr.size
+    nbins = edges.size - 1
+    out = np.empty(vals.size)
+    for t in range(vals.size):
+        v = vals[t]
+        if np.isnan(v):
+            out[t] = np.nan
+        elif v < x_min:
+            out[t] = 0.0
+        elif inv_dx == 0.0:
+            # Degenerate distribution: every stored value equals x_min.
+            out[t] = float(n_arr)
+        else:
+            k = int((v - x_min) * inv_dx)
+            if k >= nbins:
+                out[t] = float(n_arr)
+            else:
+                # Start from the table's rank for the bin's left edge and
+                # refine with short scans; the bounds are plain array limits
+                # so float rounding of the grid edges can never skew the
+                # result.
+                j = edges[k]
+                while j < n_arr and arr[j] <= v:
+                    j += 1
+                while j > 0 and arr[j - 1] > v:
+                    j -= 1
+                out[t] = float(j)
+    return out
+
+
+def tod_percentile_index(
+    model: Dict[int, np.ndarray], bins: int = 256
+) -> Dict[int, tuple]:
+    """Precompute uniform-grid lookup tables for a frozen percentile model.
+
+    Parameters
+    ----------
+    model:
+        Output of :func:`tod_percentile_fit`.
+    bins:
+        Number of uniform bins spanning each minute's value range.
+
+    Returns
+    -------
+    dict
+        Mapping ``minute_of_day -> (x_min, inv_dx, edges, sorted_vals)``
+        accepted by :func:`tod_percentile_transform` in place of the plain
+        sorted arrays.  Queries against the indexed form cost O(1) per
+        sample instead of O(log N), which pays off when the same model is
+        reused across many live transforms.
+    """
+
+    index: Dict[int, tuple] = {}
+    for minute, arr in model.items():
+        arr = np.asarray(arr, dtype=np.float64)
+        if arr.size == 0:
+            continue
+        x_min = float(arr[0])
+        span = float(arr[-1]) - x_min
+        if span <= 0:
+            inv_dx = 0.0
+            edges = np.full(bins + 1, arr.size, dtype=np.int64)
+        else:
+            inv_dx = bins / span
+            grid = x_min + np.arange(bins + 1) / inv_dx
+            edges = np.searchsorted(arr, grid, side="right").astype(np.int64)
+        index[int(minute)] = (x_min, inv_dx, edges, arr)
+    return index
+
+
+def _percentile_scores(
+    x: pd.Series, model: Dict[int, np.ndarray]
+) -> np.ndarray:
+    """Return the empirical percentile score of every sample in ``x``.
+
+    Shared rank kernel behind :func:`tod_percentile_transform` and
+    :func:`tod_percentile_bands`; scores are in ``[0, 1]`` with ``NaN`` for
+    minutes absent from ``model``.
+    """
+
+    if not isinstance(x.index, pd.DatetimeIndex):
+        raise TypeError("x must be indexed by a DatetimeIndex")
+
+    minute_of_day = (x.index.hour * 60 + x.index.minute).to_numpy()
+    vals = x.to_numpy(dtype=np.float64, copy=False)
+
+    # Group samples by minute-of-day and issue one vectorized searchsorted
+    # per bucket (at most 1440) instead of one scalar call per row.
+    out = np.full(len(x), np.nan)
+    order = np.argsort(minute_of_day, kind="stable")
+    sorted_mod = minute_of_day[order]
+    sorted_vals = vals[order]
+    uniq, starts = np.unique(sorted_mod, return_index=True)
+    bounds = np.append(starts, len(sorted_mod))
+    for minute, lo, hi in zip(uniq, bounds[:-1], bounds[1:]):
+        entry = model.get(int(minute))
+        if entry is None:
+            continue
+        if isinstance(entry, tuple):
+            x_min, inv_dx, edges, arr = entry
+            ranks = _indexed_ranks_nb(
+                arr, edges, x_min, inv_dx, sorted_vals[lo:hi]
+            )
+        else:
+            arr = entry
+            if len(arr) == 0:
+                continue
+            queries = sorted_vals[lo:hi]
+            ranks = np.searchsorted(arr, queries, side="right").astype(
+                np.float64
+            )
+            # searchsorted places NaN past every edge, which would score a
+            # missing observation as the 100th percentile; propagate NaN
+            # instead, matching _indexed_ranks_nb.
+            ranks[np.isnan(queries)] = np.nan
+        out[order[lo:hi]] = ranks / len(arr)
+
+    # Ranks are already in [0, 1]; no final clip needed.
+    return out
+
+
 def tod_percentile_transform(
     x: pd.Series,
     model: Dict[int, np.ndarray],
@@ -82,7 +288,8 @@ def tod_percentile_transform(
     x:
         Series indexed by ``pd.DatetimeIndex`` to transform.
     model:
-        Output of :func:`tod_percentile_fit`.
+        Output of :func:`tod_percentile_fit`, or its indexed form from
+        :func:`tod_percentile_index` for O(1) lookups.
 
     Returns
     -------
@@ -91,17 +298,39 @@ def tod_percentile_transform(
         ``model`` yield ``NaN`` values instead of raising ``KeyError``.
     """
 
-    if not isinstance(x.index, pd.DatetimeIndex):
-        raise TypeError("x must be indexed by a DatetimeIndex")
+    return pd.Series(_percentile_scores(x, model), index=x.index)
 
-    minute_of_day = x.index.hour * 60 + x.index.minute
-    result = []
-    for val, mod in zip(x.to_numpy(), minute_of_day):
-        arr = model.get(int(mod))
-        if arr is None or len(arr) == 0:
-            result.append(np.nan)
-            continue
-        rank = np.searchsorted(arr, val, side="right")
-        result.append(rank / len(arr))
 
-    return pd.Series(result, index=x.index).clip(0.0, 1.0)
+def tod_percentile_bands(
+    x: pd.Series,
+    model: Dict[int, np.ndarray],
+    qs: Sequence[float] = (0.5, 0.75, 0.9),
+) -> pd.DataFrame:
+    """Flag which percentile bands each value of ``x`` reaches.
+
+    The empirical percentile score of every sample is computed once and
+    compared against all thresholds in ``qs`` with a single broadcast, so
+    asking for several bands costs no more than one
+    :func:`tod_percentile_transform` call.
+
+    Parameters
+    ----------
+    x:
+        Series indexed by ``pd.DatetimeIndex``.
+    model:
+        Output of :func:`tod_percentile_fit` or :func:`tod_percentile_index`.
+    qs:
+        Percentile thresholds in ``[0, 1]``, one output column each.
+
+    Returns
+    -------
+    pd.DataFrame
+        Boolean frame indexed like ``x`` with one column per threshold,
+        ``True`` where the sample's percentile score is at least that
+        threshold. Samples whose minute is absent from ``model`` are
+        ``False`` in every column.
+    """
+
+    scores = _percentile_scores(x, model)
+    bands = scores[:, None] >= np.asarray(qs, dtype=np.float64)[None, :]
+    return pd.DataFrame(bands, index=x.index, columns=list(qs))
@@ -8,10 +8,17 @@ curvature
     Second discrete derivative (curvature) of a series.
 tension
     Weighted combination ``alpha*(1 - e_hat) - beta*l_hat``.
+velocity_curvature
+    Both derivatives from a single fused NumPy pass.
+tension_np
+    In-place NumPy variant of :func:`tension`.
 """
 
 from __future__ import annotations
 
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
 
@@ -29,17 +36,33 @@ def velocity(series: pd.Series) -> pd.Series:
         Velocity aligned with the input index where ``result[i] = series[i] - series[i-1]``.
     """
 
-    return series.diff()
+    a = series.to_numpy(copy=False)
+    if not np.issubdtype(a.dtype, np.floating):
+        a = a.astype(np.float64)
+    v = np.empty_like(a)
+    if v.size:
+        v[0] = np.nan
+    np.subtract(a[1:], a[:-1], out=v[1:])
+    return pd.Series(v, index=series.index, name=series.name)
 
 
 def curvature(series: pd.Series) -> pd.Series:
     """Return the causal second difference of ``series``.
 
-    This is simply the discrete difference of the velocity, equivalent to
-    ``series.diff().diff()``.
+    Numerically identical to ``series.diff().diff()`` but computed on the
+    raw buffer with the prefix NaNs written directly, skipping the two
+    intermediate Series and their NaN-shifting realignment.
     """
 
-    return series.diff().diff()
+    a = series.to_numpy(copy=False)
+    if not np.issubdtype(a.dtype, np.floating):
+        a = a.astype(np.float64)
+    c = np.empty_like(a)
+    c[:2] = np.nan
+    if a.size > 2:
+        # Same association as diff().diff(): (a[i]-a[i-1]) - (a[i-1]-a[i-2]).
+        np.subtract(a[2:] - a[1:-1], a[1:-1] - a[:-2], out=c[2:])
+    return pd.Series(c, index=series.index, name=series.name)
 
 
 def tension(e_hat: pd.Series, l_hat: pd.Series, *, alpha: float = 0.6, beta: float = 0.4) -> pd.Series:
@@ -59,3 +82,55 @@ def tension(e_hat: pd.Series, l_hat: pd.Series, *, alpha: float = 0.6, beta: flo
     """
 
     return alpha * (1 - e_hat) - beta * l_hat
+
+
+def velocity_curvature(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Return velocity and curvature of ``series`` in one fused pass.
+
+    Equivalent to ``(velocity(series), curvature(series))`` but computed on
+    the underlying float64 buffer with two contiguous ufunc passes, skipping
+    pandas' per-``diff`` index alignment and intermediate Series.
+    """
+
+    a = series.to_numpy(copy=False)
+    if not np.issubdtype(a.dtype, np.floating):
+        a = a.astype(np.float64)
+    n = a.size
+    v = np.empty(n, a.dtype)
+    c = np.empty(n, a.dtype)
+    if n > 0:
+        v[0] = np.nan
+        c[0] = np.nan
+    if n > 1:
+        c[1] = np.nan
+        np.subtract(a[1:], a[:-1], out=v[1:])
+    if n > 2:
+        np.subtract(v[2:], v[1:-1], out=c[2:])
+    return (
+        pd.Series(v, index=series.index, name=series.name),
+        pd.Series(c, index=series.index, name=series.name),
+    )
+
+
+def tension_np(
+    e_hat: pd.Series,
+    l_hat: pd.Series,
+    *,
+    alpha: float = 0.6,
+    beta: float = 0.4,
+) -> pd.Series:
+    """In-place NumPy variant of :func:`tension`.
+
+    Computes ``alpha * (1 - e_hat) - beta * l_hat`` into a single output
+    buffer instead of allocating one intermediate per pandas operator.
+    """
+
+    e = e_hat.to_numpy(copy=False)
+    if not np.issubdtype(e.dtype, np.floating):
+        e = e.astype(np.float64)
+    lam = l_hat.to_numpy(copy=False)
+    buf = np.empty_like(e)
+    np.subtract(1.0, e, out=buf)
+    buf *= alpha
+    buf -= beta * lam
+    return pd.Series(buf, index=e_hat.index)
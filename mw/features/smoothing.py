@@ -3,7 +3,43 @@
 Exports:
 - ema(series: pd.Series, span: int = 3) -> pd.Series
 """
+import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _ema_nb(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Scalar EWM recurrence matching pandas' ``adjust=False`` semantics.
+
+    Leading NaNs stay NaN; interior NaNs carry the last smoothed value while
+    the old-value weight keeps decaying, so the next valid observation is
+    combined with the documented ``ignore_na=False`` normalisation.
+    """
+    n = x.size
+    out = np.empty(n, x.dtype)
+    decay = 1.0 - alpha
+    y = np.nan
+    old_wt = 1.0
+    started = False
+    for i in range(n):
+        v = x[i]
+        if not started:
+            if np.isnan(v):
+                out[i] = np.nan
+            else:
+                y = v
+                started = True
+                out[i] = y
+            continue
+        old_wt *= decay
+        if np.isnan(v):
+            out[i] = y
+        else:
+            y = (old_wt * y + alpha * v) / (old_wt + alpha)
+            old_wt = 1.0
+            out[i] = y
+    return out
 
 
 def ema(series: pd.Series, span: int = 3) -> pd.Series:
@@ -29,5 +65,11 @@ def ema(series: pd.Series, span: int = 3) -> pd.Series:
     if span <= 0:
         raise ValueError("span must be positive")
 
-    result = series.ewm(span=span, adjust=False).mean()
-    return result.loc[series.index]
+    alpha = 2.0 / (span + 1.0)
+    # Preserve float32 inputs so downstream passes keep the halved footprint.
+    values = series.to_numpy(copy=False)
+    if values.dtype != np.float32:
+        values = values.astype(np.float64, copy=False)
+    return pd.Series(
+        _ema_nb(values, alpha), index=series.index, name=series.name, copy=False
+    )
@@ -21,14 +21,26 @@ from __future__ import annotations
 
 import hashlib
 from typing import Any, Dict, Optional
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
-import pytz
 
-from mw.utils.ohlc_checks import validate_ohlc
 from mw.utils.persistence import write_json, write_parquet
 
-ET_TZ = pytz.timezone("America/New_York")
+ET_TZ = ZoneInfo("America/New_York")
+
+# Tuples rather than lists: iterated on every call, and immutable at module
+# scope so no per-call literal rebuild.
+_OHLC_COLS = ("open", "high", "low", "close")
+_DERIVED_COLS = ("is_gap", "minute_of_day", "is_session", "quality_score")
+
+
+def _empty_canonical() -> pd.DataFrame:
+    """Return a zero-row frame carrying the canonical column contract."""
+    return pd.DataFrame(columns=list(_OHLC_COLS + _DERIVED_COLS)).set_index(
+        pd.DatetimeIndex([], name="timestamp", tz="UTC")
+    )
 
 
 def _hash_df(df: pd.DataFrame) -> str:
@@ -40,8 +52,11 @@ def _hash_df(df: pd.DataFrame) -> str:
     obtain the final hexadecimal string.
     """
 
-    row_hashes = pd.util.hash_pandas_object(df, index=True).values.tobytes()
-    return hashlib.sha256(row_hashes).hexdigest()
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    hasher = hashlib.sha256(usedforsecurity=False)
+    # memoryview feeds the uint64 buffer to SHA256 without a bytes copy.
+    hasher.update(memoryview(row_hashes).cast("B"))
+    return hasher.hexdigest()
 
 
 def canonicalize(
@@ -51,6 +66,7 @@ def canonicalize(
     *,
     source: Optional[str] = None,
     source_time_basis: Optional[str] = None,
+    dtype: str = "float64",
 ) -> pd.DataFrame:
     """Canonicalise ``df`` and persist the result to ``parquet_path``.
 
@@ -70,6 +86,10 @@ def canonicalize(
         Identifier describing the origin of ``df``.
     source_time_basis:
         Timezone string describing the timezone of the raw timestamps.
+    dtype:
+        Floating dtype for the OHLC columns, ``"float64"`` by default.
+        ``"float32"`` halves the memory traffic of every downstream rolling
+        pass at roughly seven significant digits of price precision.
 
     Returns
     -------
@@ -80,106 +100,167 @@ def canonicalize(
         is returned and metadata files are still written with zero counts.
     """
     if source_time_basis is None:
-        source_time_basis = df.attrs.get("source_time_basis", ET_TZ.zone)
-    source_tz = pytz.timezone(source_time_basis)
+        source_time_basis = df.attrs.get("source_time_basis", ET_TZ.key)
+    source_tz = ZoneInfo(source_time_basis)
+
+    # ``df`` is never mutated: the canonical frame is assembled from scratch
+    # on the minute grid, so no defensive full-frame copy is needed.
+    loaded_at = pd.Timestamp.utcnow().isoformat()
+    meta_path = f"{parquet_path}.meta.json"
 
-    working = df.copy()
-    ohlc_cols = ["open", "high", "low", "close"]
+    def _finalise(
+        working: pd.DataFrame, duplicates: int, clip_count: int, gaps: int
+    ) -> pd.DataFrame:
+        """Hash, write parquet plus metadata and return ``working``.
 
-    def _persist_empty_result(clip_count: int, duplicates: int = 0) -> pd.DataFrame:
-        empty = pd.DataFrame(
-            columns=ohlc_cols
-            + ["is_gap", "minute_of_day", "is_session", "quality_score"]
-        ).set_index(pd.DatetimeIndex([], name="timestamp", tz="UTC"))
+        Shared tail for the empty and populated paths so the metadata and
+        persistence logic lives in exactly one place.
+        """
         metadata: Dict[str, Any] = {
-            "rows": 0,
+            "rows": int(len(working)),
             "duplicates": duplicates,
-            "gaps": 0,
+            "gaps": gaps,
             "contract_version": contract_version,
             "source": source,
             "source_time_basis": source_time_basis,
-            "loaded_at": pd.Timestamp.utcnow().isoformat(),
+            "loaded_at": loaded_at,
             "clip_count": clip_count,
         }
-        metadata["hash"] = _hash_df(empty)
-        out_df = empty.reset_index().rename(columns={"index": "timestamp"})
-        write_parquet(out_df, parquet_path)
-        write_json(metadata, f"{parquet_path}.meta.json")
-        return empty
+        metadata["hash"] = _hash_df(working)
+        out_df = working.reset_index().rename(columns={"index": "timestamp"})
+        # Compact dtypes before the write: the flag columns dictionary/RLE
+        # encode to almost nothing and quality_score is constant per row
+        # group, so the parquet bytes (and therefore write time) shrink.
+        out_df = out_df.astype(
+            {
+                "is_gap": "bool",
+                "is_session": "bool",
+                "minute_of_day": "int16",
+                "quality_score": "float32",
+            }
+        )
+        write_parquet(
+            out_df,
+            parquet_path,
+            compression="zstd",
+            use_dictionary=["is_gap", "is_session"],
+            row_group_size=8192,
+        )
+        # Metadata is rewritten alongside every canonicalization; the
+        # atomic rename alone is enough — a crash just leaves the previous
+        # snapshot.
+        write_json(metadata, meta_path, durable=False)
+        return working
 
-    if working.empty:
+    if df.empty:
         # Persist empty outputs early and return
-        return _persist_empty_result(clip_count=0)
+        return _finalise(_empty_canonical(), 0, 0, 0)
 
     # ------------------------------------------------------------------
-    # Timestamp normalisation
-    ts = pd.to_datetime(working["timestamp"])
-    if ts.dt.tz is None:
-        ts = ts.dt.tz_localize(source_tz)
+    # Timestamp normalisation on a standalone DatetimeIndex; zoneinfo
+    # localisation uses pandas' C-level transition arrays instead of pytz's
+    # per-element lookups.  Columns that already carry a datetime64 dtype
+    # (the common case for adapter output and concatenated WS micro-batches)
+    # wrap into an index directly, skipping to_datetime's inference scan.
+    ts_col = df["timestamp"]
+    if ts_col.dtype.kind == "M":
+        idx = pd.DatetimeIndex(ts_col)
     else:
-        ts = ts.dt.tz_convert(source_tz)
-    ts = ts.dt.tz_convert("UTC")
-    working["timestamp"] = ts
+        idx = pd.DatetimeIndex(pd.to_datetime(ts_col, cache=True))
+    if idx.tz is None:
+        idx = idx.tz_localize(source_tz)
+    else:
+        idx = idx.tz_convert(source_tz)
+    utc_idx = idx.tz_convert("UTC")
 
-    # Sort and remove duplicate timestamps, keeping the last observation.
-    working = working.sort_values("timestamp")
-    duplicate_count = int(working["timestamp"].duplicated(keep="last").sum())
-    working = working.drop_duplicates(subset="timestamp", keep="last")
+    # ------------------------------------------------------------------
+    # Bucket observations onto the one-minute grid in a single O(n) pass.
+    # Scattering row numbers with fancy assignment keeps only the final
+    # write per minute, which reproduces the previous
+    # ``sort_values`` + ``drop_duplicates(keep="last")`` + ``reindex``
+    # pipeline without its O(n log n) passes or intermediate frames.
+    # ``as_unit`` pins the epoch view to nanoseconds regardless of the
+    # resolution ``to_datetime`` inferred from the raw stamps.
+    ns_per_min = 60_000_000_000
+    minutes = utc_idx.as_unit("ns").asi8 // ns_per_min
+    m0 = int(minutes.min())
+    n_slots = int(minutes.max()) - m0 + 1
+    slot = (minutes - m0).astype(np.intp)
+    last_row = np.full(n_slots, -1, dtype=np.intp)
+    last_row[slot] = np.arange(slot.size)
+    obs_slot = np.flatnonzero(last_row >= 0)
+    sel = last_row[obs_slot]
+    duplicate_count = int(slot.size - obs_slot.size)
 
     # ------------------------------------------------------------------
-    # OHLC integrity checks
-    valid_mask, clipped = validate_ohlc(working[ohlc_cols], return_clipped=True)
-    invalid_mask = ~valid_mask
-    clip_count = int(invalid_mask.sum())
+    # OHLC integrity checks on the surviving per-minute observations.
+    # The relationship is validated inline as fused ufunc comparisons on
+    # the four contiguous arrays rather than through validate_ohlc, which
+    # would materialize a column-slice frame and a clipped copy per call.
+    price_dtype = np.dtype(dtype)
+    o, h, l, c = (df[k].to_numpy(dtype=price_dtype)[sel] for k in _OHLC_COLS)
+    valid = (l <= o) & (o <= h) & (l <= c) & (c <= h)
+    bad = np.flatnonzero(~valid)
+    clip_count = int(bad.size)
     if clip_count:
-        working.loc[invalid_mask, ohlc_cols] = clipped.loc[invalid_mask]
-        final_mask = validate_ohlc(working[ohlc_cols])
-        if not bool(final_mask.all()):
-            working = working[final_mask]
-    else:
-        clip_count = 0
+        # Same repair validate_ohlc applies: swap high/low into order and
+        # clip open/close into the band, then re-check only the repaired
+        # rows -- NaNs survive the clip and must still be dropped.
+        hi = np.maximum(h[bad], l[bad])
+        lo = np.minimum(h[bad], l[bad])
+        o[bad] = np.clip(o[bad], lo, hi)
+        c[bad] = np.clip(c[bad], lo, hi)
+        h[bad] = hi
+        l[bad] = lo
+        fixed = (
+            (lo <= o[bad]) & (o[bad] <= hi) & (lo <= c[bad]) & (c[bad] <= hi)
+        )
+        if not fixed.all():
+            keep = np.ones(o.size, dtype=bool)
+            keep[bad[~fixed]] = False
+            o, h, l, c = o[keep], h[keep], l[keep], c[keep]
+            obs_slot = obs_slot[keep]
+            sel = sel[keep]
 
-    if working.empty:
-        return _persist_empty_result(clip_count, duplicate_count)
+    if o.size == 0:
+        return _finalise(_empty_canonical(), duplicate_count, clip_count, 0)
 
     # ------------------------------------------------------------------
-    # Enforce strict one-minute grid and mark gaps
-    working = working.set_index("timestamp")
-    full_index = pd.date_range(
-        start=working.index.min(),
-        end=working.index.max(),
-        freq="1min",
-        tz="UTC",
-    )
-    working = working.reindex(full_index)
+    # Build the canonical frame directly on the grid spanned by the
+    # surviving observations; gap rows are simply the slots no write reached.
+    grid_pos = obs_slot - obs_slot[0]
+    n_rows = int(grid_pos[-1]) + 1
+    grid_start = pd.Timestamp(
+        (m0 + int(obs_slot[0])) * ns_per_min, tz="UTC"
+    ).as_unit(utc_idx.unit)
+    full_index = pd.date_range(start=grid_start, periods=n_rows, freq="1min")
+    ohlc_arrays = dict(zip(_OHLC_COLS, (o, h, l, c)))
+    data: Dict[str, Any] = {}
+    for name in df.columns:
+        if name == "timestamp":
+            continue
+        if name in ohlc_arrays:
+            col = np.full(n_rows, np.nan, dtype=price_dtype)
+            col[grid_pos] = ohlc_arrays[name]
+            data[name] = col
+        else:
+            data[name] = pd.Series(
+                df[name].to_numpy()[sel], index=full_index[grid_pos]
+            ).reindex(full_index)
+    working = pd.DataFrame(data, index=full_index)
 
-    gap_mask = working[ohlc_cols].isna().all(axis=1)
+    gap_mask = np.ones(n_rows, dtype=bool)
+    gap_mask[grid_pos] = False
     working["is_gap"] = gap_mask
-    working["minute_of_day"] = working.index.hour * 60 + working.index.minute
-    working["is_session"] = working.index.dayofweek < 5
+    # Field extraction via integer arithmetic on the grid's minute numbers;
+    # the index is UTC so no tz-aware accessor round trip is needed.  Epoch
+    # day 0 (1970-01-01) was a Thursday, hence the +3 to align Monday to 0.
+    grid_minutes = m0 + int(obs_slot[0]) + np.arange(n_rows, dtype=np.int64)
+    working["minute_of_day"] = (grid_minutes % 1440).astype(np.int16)
+    working["is_session"] = (grid_minutes // 1440 + 3) % 7 < 5
     working["quality_score"] = 1.0
-    gap_count = int(gap_mask.sum())
 
-    # ------------------------------------------------------------------
-    # Metadata and persistence
-    metadata: Dict[str, Any] = {
-        "rows": int(len(working)),
-        "duplicates": duplicate_count,
-        "gaps": gap_count,
-        "contract_version": contract_version,
-        "source": source,
-        "source_time_basis": source_time_basis,
-        "loaded_at": pd.Timestamp.utcnow().isoformat(),
-        "clip_count": clip_count,
-    }
-    metadata["hash"] = _hash_df(working)
-
-    # Write parquet and metadata JSON atomically
-    out_df = working.reset_index().rename(columns={"index": "timestamp"})
-    write_parquet(out_df, parquet_path)
-    write_json(metadata, f"{parquet_path}.meta.json")
-
-    return working
+    return _finalise(working, duplicate_count, clip_count, int(gap_mask.sum()))
 
 
 __all__ = ["canonicalize"]
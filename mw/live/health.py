@@ -21,8 +21,9 @@ def compute_freshness(last_bar_ts: Optional[datetime]) -> float:
     if last_bar_ts is None:
         return float("inf")
 
-    now = datetime.now(timezone.utc)
-    return (now - last_bar_ts).total_seconds()
+    # Subtract POSIX floats rather than building an intermediate timedelta;
+    # this path is polled every second by the live loop.
+    return datetime.now(timezone.utc).timestamp() - last_bar_ts.timestamp()
 
 
 def should_degrade(freshness_s: float, thresh: float = 180.0) -> bool:
@@ -52,4 +53,4 @@ def evaluate_freshness(
     """
 
     freshness = compute_freshness(last_bar_ts)
-    return freshness, should_degrade(freshness, thresh)
+    return freshness, freshness > thresh
@@ -6,17 +6,22 @@ and write a JSON session summary on shutdown.
 
 from __future__ import annotations
 
-import json
+import io
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
-from mw.utils.persistence import append_csv, write_json
+import orjson
+
+from mw.utils.persistence import write_json
 from mw.utils.time import now_utc
 
+_CSV_FIELDS = ("timestamp", "score", "state", "diagnostics")
 
-@dataclass
+
+@dataclass(slots=True)
 class GapEvent:
     """Represents a missing minute bar in the data feed."""
 
@@ -25,7 +30,7 @@ class GapEvent:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateDrop:
     """Represents a dropped duplicate bar."""
 
@@ -33,7 +38,7 @@ class DuplicateDrop:
     symbol: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LateBar:
     """Represents a bar that arrived too late to be processed."""
 
@@ -57,6 +62,65 @@ class SessionLogger:
     late_bar_count: int = 0
     seen_bars: int = 0
     max_api_latency: float = 0.0
+    _fh: Any = field(default=None, init=False, repr=False, compare=False)
+    _diag_keys: Any = field(default=None, init=False, repr=False, compare=False)
+    _diag_fmt: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Open the CSV once for the whole session: per-minute logging then
+        # costs a single buffered write instead of open/stat/close syscalls
+        # on every call.
+        self.csv_path = Path(self.csv_path)
+        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self.csv_path.exists()
+        # Explicit unbuffered-binary -> BufferedWriter -> TextIOWrapper stack
+        # so all csv fragments for a minute coalesce into one 64 KiB-buffered
+        # write, flushed once per log_minute call.
+        raw = self.csv_path.open("ab", buffering=0)
+        self._fh = io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=1 << 16),
+            newline="",
+            write_through=False,
+        )
+        if new_file:
+            self._fh.write(",".join(_CSV_FIELDS) + "\r\n")
+
+    def compile_diagnostics_schema(self, keys: List[str]) -> None:
+        """Freeze the diagnostics dict shape for fast serialization.
+
+        When the per-minute diagnostics always carry the same scalar keys,
+        the JSON key strings can be encoded once here; ``log_minute`` then
+        fills a precompiled format string instead of re-serializing the
+        keys every call. Dicts that do not match the declared shape fall
+        back to full orjson encoding.
+        """
+
+        self._diag_keys = tuple(keys)
+        self._diag_fmt = (
+            "{"
+            + ",".join(orjson.dumps(k).decode() + ":%s" for k in keys)
+            + "}"
+        )
+
+    def _encode_diagnostics(self, diagnostics: Dict[str, Any]) -> str:
+        if self._diag_fmt is not None and len(diagnostics) == len(
+            self._diag_keys
+        ):
+            try:
+                values = tuple(diagnostics[k] for k in self._diag_keys)
+            except KeyError:
+                values = None
+            # The %s interpolation is only valid JSON for finite numbers:
+            # strings would lose their quotes, bools render as True/False
+            # and non-finite floats as nan/inf. Anything else falls back
+            # to full orjson encoding.
+            if values is not None and all(
+                (isinstance(v, float) and math.isfinite(v))
+                or (isinstance(v, int) and not isinstance(v, bool))
+                for v in values
+            ):
+                return self._diag_fmt % values
+        return orjson.dumps(diagnostics).decode()
 
     def log_minute(
         self,
@@ -65,23 +129,31 @@ class SessionLogger:
         state: str,
         diagnostics: Dict[str, Any],
     ) -> None:
-        """Append a record for ``timestamp`` to the CSV file."""
-
-        append_csv(
-            {
-                "timestamp": timestamp.isoformat(),
-                "score": score,
-                "state": state,
-                "diagnostics": json.dumps(diagnostics),
-            },
-            self.csv_path,
-            ["timestamp", "score", "state", "diagnostics"],
+        """Append a record for ``timestamp`` to the CSV file.
+
+        Directory creation and the header/existence check happen once in
+        ``__post_init__``; this path performs no filesystem metadata calls.
+        """
+
+        # The row shape is fixed, so the line is formatted directly instead
+        # of going through the csv module's quoting state machine. Only the
+        # diagnostics field can contain commas or quotes; it is wrapped and
+        # doubled-quote escaped by hand per RFC 4180.
+        diag = self._encode_diagnostics(diagnostics).replace('"', '""')
+        self._fh.write(
+            '%s,%s,%s,"%s"\r\n'
+            % (timestamp.isoformat(), score, state, diag)
         )
+        # One flush per minute keeps rows durable without per-fragment
+        # syscalls.
+        self._fh.flush()
         self.rows += 1
 
     def close(self, **extra: Any) -> None:
-        """Write a JSON summary of the session."""
+        """Flush the CSV handle and write a JSON summary of the session."""
 
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
         summary = {
             "start": self.start.isoformat(),
             "end": now_utc().isoformat(),
@@ -100,18 +172,36 @@ class SessionLogger:
         self.gap_events.append(event)
         self.gap_count += 1
 
+    def log_gaps(self, events: List[GapEvent]) -> None:
+        """Record several missing minute bars at once."""
+
+        self.gap_events.extend(events)
+        self.gap_count += len(events)
+
     def log_duplicate(self, event: DuplicateDrop) -> None:
         """Record a dropped duplicate bar."""
 
         self.duplicate_events.append(event)
         self.duplicate_count += 1
 
+    def log_duplicates(self, events: List[DuplicateDrop]) -> None:
+        """Record several dropped duplicate bars at once."""
+
+        self.duplicate_events.extend(events)
+        self.duplicate_count += len(events)
+
     def log_late_bar(self, event: LateBar) -> None:
         """Record a bar that arrived too late to be processed."""
 
         self.late_bar_events.append(event)
         self.late_bar_count += 1
 
+    def log_late_bars(self, events: List[LateBar]) -> None:
+        """Record several late bars at once."""
+
+        self.late_bar_events.extend(events)
+        self.late_bar_count += len(events)
+
     def log_seen_bars(self, count: int) -> None:
         """Increment the count of bars seen this session."""
 
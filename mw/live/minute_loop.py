@@ -8,11 +8,23 @@ The function waits for configured offsets from the start of the current
 minute before invoking each step so that calls are synchronised with
 minute boundaries.  Offsets (in seconds) are supplied via ``params`` and
 default to a small stagger between steps.
+
+Deadlines are tracked on the monotonic clock — the wall clock is read once
+per minute to anchor the minute boundary — and the loop itself is async:
+:func:`run_minute_loop_async` awaits between steps with ``asyncio.sleep``
+and accepts coroutine step callables, so polling I/O can overlap with
+waits.  :func:`run_minute_loop` wraps it for synchronous callers.
 """
 
+import asyncio
+import collections
+import inspect
 import logging
-import time
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from time import monotonic, perf_counter
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
@@ -25,7 +37,150 @@ from mw.utils.persistence import write_parquet
 from mw.utils.time import floor_to_minute, now_utc
 
 _LAST_TS_SEEN: Optional[datetime] = None
-_BARS_PATH = Path("data") / "minute_bars.parquet"
+# Root of the output hierarchy. A module attribute (not a hardcoded
+# relative path inside each writer) so tests can point it at a temp
+# directory instead of chdir-ing, which keeps them safe to parallelize.
+_DATA_DIR = Path("data")
+_COMPACT_EVERY = 60
+_PART_SEQ: Optional[int] = None
+
+# Background pool for parquet writeout: submissions form a bounded FIFO so
+# the loop's compute/log steps overlap with disk I/O instead of blocking on
+# it. Parquet encoding releases the GIL inside pyarrow, so independent
+# writes (one per feature frame) genuinely run in parallel; writes that
+# must stay ordered (bars part + compaction) are submitted as one task.
+_WRITE_POOL: Optional[ThreadPoolExecutor] = None
+_WRITE_WORKERS = 4
+_INFLIGHT: "collections.deque[Future]" = collections.deque()
+_MAX_INFLIGHT = 8
+
+
+def _submit_write(fn: Callable, *args: Any) -> None:
+    """Queue ``fn(*args)`` on the background write pool.
+
+    Applies back-pressure by blocking on the oldest pending write once
+    ``_MAX_INFLIGHT`` submissions are outstanding.
+    """
+
+    global _WRITE_POOL
+    if _WRITE_POOL is None:
+        _WRITE_POOL = ThreadPoolExecutor(
+            max_workers=_WRITE_WORKERS, thread_name_prefix="mw-write"
+        )
+    while len(_INFLIGHT) >= _MAX_INFLIGHT:
+        _INFLIGHT.popleft().result()
+    _INFLIGHT.append(_WRITE_POOL.submit(fn, *args))
+
+
+def drain_writes() -> None:
+    """Block until every queued parquet write has completed.
+
+    Called at the end of each loop pass (and usable at shutdown) so
+    readers of the ``data/`` hierarchy observe all writes from the minute.
+    """
+
+    while _INFLIGHT:
+        fut = _INFLIGHT.popleft()
+        try:
+            fut.result()
+        except Exception:
+            logging.exception("Background parquet write failed")
+
+
+def _bars_path() -> Path:
+    """Parquet *dataset* directory for minute bars.
+
+    Each polled batch lands as a new part file, so the per-minute write
+    cost is O(batch) instead of rewriting the whole history, and the
+    accumulated history is never re-read on the hot path — only the
+    periodic compaction touches it. ``pd.read_parquet`` on the directory
+    returns the union of parts.
+    """
+
+    return _DATA_DIR / "minute_bars.parquet"
+
+
+def _write_bars_part(df: pd.DataFrame, path: Path) -> None:
+    """Atomically write ``df`` as one part file of the bars dataset.
+
+    The temp file uses a ``.tmp`` suffix so dataset readers never pick up a
+    half-written part.
+    """
+
+    tmp = tempfile.NamedTemporaryFile(
+        delete=False, dir=str(path.parent), suffix=".tmp"
+    )
+    tmp.close()
+    try:
+        df.to_parquet(tmp.name, index=False)
+        os.replace(tmp.name, path)
+    except OSError:
+        try:
+            os.remove(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+def _next_part_path() -> Path:
+    """Return the next sequence-numbered part path, creating the dataset.
+
+    A legacy single-file ``minute_bars.parquet`` is migrated in place to the
+    directory layout on first use.
+    """
+
+    global _PART_SEQ
+    bars = _bars_path()
+    legacy = None
+    if bars.is_file():
+        legacy = pd.read_parquet(bars)
+        bars.unlink()
+    bars.mkdir(parents=True, exist_ok=True)
+    if _PART_SEQ is None:
+        existing = sorted(bars.glob("part-*.parquet"))
+        _PART_SEQ = int(existing[-1].stem.split("-")[1]) + 1 if existing else 0
+    if legacy is not None:
+        _write_bars_part(legacy, bars / f"part-{_PART_SEQ:06d}.parquet")
+        _PART_SEQ += 1
+    path = bars / f"part-{_PART_SEQ:06d}.parquet"
+    _PART_SEQ += 1
+    return path
+
+
+def _compact_bars() -> None:
+    """Merge all part files into one deduplicated, sorted part."""
+
+    bars = _bars_path()
+    parts = sorted(bars.glob("part-*.parquet"))
+    if len(parts) <= 1:
+        return
+    combined = pd.read_parquet(bars)
+    # Parts are read in sequence order and each batch is sorted and
+    # strictly after the previous one (the _LAST_TS_SEEN filter drops any
+    # overlap), so the union is normally already sorted and unique — an
+    # O(n) monotonicity check replaces the hash dedup and sort. The slow
+    # path only runs if out-of-order parts slipped in (e.g. a migrated
+    # legacy file).
+    ts = combined["timestamp"]
+    if not (ts.is_monotonic_increasing and ts.is_unique):
+        combined = combined.drop_duplicates(subset=["timestamp"]).sort_values(
+            "timestamp"
+        )
+    _write_bars_part(combined, _next_part_path())
+    for part in parts:
+        part.unlink()
+
+
+def _write_bars_batch(df: pd.DataFrame, path: Path, compact: bool) -> None:
+    """Write one bars part and optionally compact, as a single ordered task.
+
+    Bundling the compaction into the same pool task keeps it strictly
+    after the part write even though the pool runs several workers.
+    """
+
+    _write_bars_part(df, path)
+    if compact:
+        _compact_bars()
 
 
 def _append_polled_bars(
@@ -53,14 +208,16 @@ def _append_polled_bars(
     new = new.sort_values("timestamp")
     if logger is not None:
         dup_mask = new["timestamp"].duplicated(keep="last")
-        for ts in new.loc[dup_mask, "timestamp"]:
-            logger.log_duplicate(DuplicateDrop(ts.to_pydatetime(), symbol))
+        # Bulk-convert the filtered timestamps in one vectorized call
+        # instead of one Timestamp.to_pydatetime per row.
+        dup_ts = new.loc[dup_mask, "timestamp"].dt.to_pydatetime()
+        logger.log_duplicates([DuplicateDrop(ts, symbol) for ts in dup_ts])
     new = new.drop_duplicates(subset=["timestamp"], keep="last")
     if _LAST_TS_SEEN is not None:
         late_mask = new["timestamp"] <= _LAST_TS_SEEN
         if logger is not None:
-            for ts in new.loc[late_mask, "timestamp"]:
-                logger.log_late_bar(LateBar(ts.to_pydatetime(), symbol))
+            late_ts = new.loc[late_mask, "timestamp"].dt.to_pydatetime()
+            logger.log_late_bars([LateBar(ts, symbol) for ts in late_ts])
         new = new[~late_mask]
         if new.empty:
             missing = _LAST_TS_SEEN + timedelta(minutes=1)
@@ -75,32 +232,38 @@ def _append_polled_bars(
             _LAST_TS_SEEN = missing
             return
         first_ts = new["timestamp"].iloc[0]
+        # Enumerate the missing minutes with one date_range instead of a
+        # Python while-loop stepping a timedelta per gap. date_range keeps
+        # the start point even with inclusive="left" when start == end, so
+        # guard on a strict gap first.
         expected = _LAST_TS_SEEN + timedelta(minutes=1)
-        while expected < first_ts:
+        if expected < first_ts:
+            missing = pd.date_range(
+                expected, first_ts, freq="1min", inclusive="left"
+            )
             if logger is not None:
-                logger.log_gap(
-                    GapEvent(expected, symbol, "no bar returned by /v2 aggs")
+                reason = "no bar returned by /v2 aggs"
+                logger.log_gaps(
+                    [
+                        GapEvent(ts, symbol, reason)
+                        for ts in missing.to_pydatetime()
+                    ]
                 )
-            _LAST_TS_SEEN = expected
-            expected += timedelta(minutes=1)
+            _LAST_TS_SEEN = missing[-1]
 
     _LAST_TS_SEEN = new["timestamp"].max()
     if logger is not None:
         logger.log_seen_bars(len(new))
 
-    if _BARS_PATH.exists():
-        existing = pd.read_parquet(_BARS_PATH)
-        combined = (
-            pd.concat([existing, new], ignore_index=True)
-            .drop_duplicates(subset=["timestamp"])
-            .sort_values("timestamp")
-        )
-    else:
-        combined = new
-    write_parquet(combined, _BARS_PATH.as_posix())
+    # Append-only: the new batch is already deduplicated and strictly after
+    # _LAST_TS_SEEN, so it lands as its own part without touching history.
+    # The part path is resolved here; the write (and any compaction, which
+    # the same task runs strictly after it) happens off-thread.
+    compact = _PART_SEQ is not None and (_PART_SEQ + 1) % _COMPACT_EVERY == 0
+    _submit_write(_write_bars_batch, new, _next_part_path(), compact)
 
 
-def run_minute_loop(
+async def run_minute_loop_async(
     poll_fn: Callable,
     compute_fn: Callable,
     persist_fn: Callable,
@@ -113,11 +276,15 @@ def run_minute_loop(
     stale_fn: Optional[Callable[[float], None]] = None,
     session_logger: Optional[SessionLogger] = None,
 ) -> None:
-    """High-level loop; call every minute (t+3s).
+    """High-level loop; await every minute (t+3s).
 
     The supplied callables are invoked sequentially with waits applied
     before each invocation to honour per-step offsets from the start of
-    the current minute.
+    the current minute.  Step deadlines live on the monotonic clock, so
+    the per-step wait is one float subtraction instead of wall-clock
+    datetime arithmetic, and waits go through ``asyncio.sleep`` so
+    coroutine step callables (awaited automatically) can overlap their
+    I/O with them.
     """
 
     if params is None:
@@ -133,7 +300,11 @@ def run_minute_loop(
 
     critical_steps = set(ml_params.critical_steps)
 
-    minute_start = floor_to_minute(now_utc())
+    # Anchor the minute boundary on the monotonic clock once; every later
+    # deadline is plain float arithmetic against it.
+    now = now_utc()
+    minute_start = floor_to_minute(now)
+    minute_start_mono = monotonic() - (now - minute_start).total_seconds()
     symbol = getattr(params, "symbol", "") if params is not None else ""
 
     stale = False
@@ -150,10 +321,12 @@ def run_minute_loop(
             if stale_fn is not None:
                 stale_fn(freshness)
 
-    def poll_step() -> None:
-        start = time.perf_counter()
+    async def poll_step() -> None:
+        start = perf_counter()
         data = poll_fn()
-        latency = time.perf_counter() - start
+        if inspect.isawaitable(data):
+            data = await data
+        latency = perf_counter() - start
         if session_logger is not None:
             session_logger.record_api_latency(latency)
         if isinstance(data, pd.DataFrame):
@@ -172,19 +345,25 @@ def run_minute_loop(
     skip_when_stale = {"compute", "persist", "log", "plot"}
     features: Any = None
 
+    # All absolute deadlines are known up front; resolve them once instead
+    # of one offsets lookup and addition per iteration.
+    deadlines = {
+        name: minute_start_mono
+        + offsets.get("compute" if name == "freshness" else name, 0)
+        for name, _ in steps
+    }
+
     for name, fn in steps:
-        offset_name = "compute" if name == "freshness" else name
-        target = minute_start + timedelta(seconds=offsets.get(offset_name, 0))
-        sleep_for = (target - now_utc()).total_seconds()
-        time.sleep(max(0.0, sleep_for))
+        await asyncio.sleep(max(0.0, deadlines[name] - monotonic()))
         if stale and name in skip_when_stale:
             continue
         try:
+            result = fn()
+            if inspect.isawaitable(result):
+                result = await result
             if name == "compute":
-                features = fn()
+                features = result
                 _persist_features(features)
-            else:
-                fn()
         except Exception as exc:
             logging.exception("Exception in %s step", name)
             if error_fn is not None:
@@ -192,16 +371,52 @@ def run_minute_loop(
             if name in critical_steps:
                 break
 
+    # Writes queued this minute overlapped with the later steps; settle
+    # them before handing the minute back to the caller.
+    drain_writes()
+
+
+def run_minute_loop(
+    poll_fn: Callable,
+    compute_fn: Callable,
+    persist_fn: Callable,
+    log_fn: Callable,
+    plot_fn: Callable,
+    health_fn: Callable,
+    params: Union["MinuteLoopParams", "Params", None],
+    error_fn: Optional[Callable[[str, Exception], None]] = None,
+    last_bar_ts_fn: Optional[Callable[[], Optional[datetime]]] = None,
+    stale_fn: Optional[Callable[[float], None]] = None,
+    session_logger: Optional[SessionLogger] = None,
+) -> None:
+    """Synchronous wrapper around :func:`run_minute_loop_async`."""
+
+    asyncio.run(
+        run_minute_loop_async(
+            poll_fn,
+            compute_fn,
+            persist_fn,
+            log_fn,
+            plot_fn,
+            health_fn,
+            params,
+            error_fn,
+            last_bar_ts_fn,
+            stale_fn,
+            session_logger,
+        )
+    )
+
 
 def _persist_features(features: Any) -> None:
     """Persist feature dataframes to the ``data/`` hierarchy."""
 
     if features is None:
         return
-    base = Path("data")
+    base = _DATA_DIR
     if isinstance(features, pd.DataFrame):
-        write_parquet(features, str(base / "features.parquet"))
+        _submit_write(write_parquet, features, str(base / "features.parquet"))
     elif isinstance(features, dict):
         for name, df in features.items():
             if isinstance(df, pd.DataFrame):
-                write_parquet(df, str(base / f"{name}.parquet"))
+                _submit_write(write_parquet, df, str(base / f"{name}.parquet"))
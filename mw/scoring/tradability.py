@@ -13,10 +13,34 @@ Exports:
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
+from numba import njit
 
 from mw.utils.params import ScoreParams
 
+# State encoding shared by the Numba kernel and the categorical mapping.
+_STATE_DTYPE = pd.CategoricalDtype(["RED", "YELLOW", "GREEN"])
+_STATE_CODES = {"RED": 0, "YELLOW": 1, "GREEN": 2}
+
+# Below this length the plain ufunc path wins; above it the fully fused
+# kernel avoids streaming the intermediate array through memory twice.
+_FUSED_SCORE_MIN_LEN = 10_000
+
+
+@njit(cache=True)
+def _score_core(e: np.ndarray, lam: np.ndarray, w1: float, w2: float) -> np.ndarray:
+    """Fused ``clip(w1*(1-e) + w2*(1-lam), 0, 1)`` in a single pass."""
+    out = np.empty_like(e)
+    for i in range(e.size):
+        v = w1 * (1.0 - e[i]) + w2 * (1.0 - lam[i])
+        if v < 0.0:
+            v = 0.0
+        elif v > 1.0:
+            v = 1.0
+        out[i] = v
+    return out
+
 
 def score_tradability(
     e_hat: pd.Series, l_hat: pd.Series, params: ScoreParams | None = None
@@ -24,9 +48,65 @@ def score_tradability(
     """𝒯 = w1*(1 - e_hat) + w2*(1 - l_hat), clipped to [0,1]."""
     params = params or ScoreParams()
     e_hat_aligned, l_hat_aligned = e_hat.align(l_hat, join="inner")
-    score = params.w1 * (1 - e_hat_aligned)
-    score += params.w2 * (1 - l_hat_aligned)
-    return score.clip(0, 1)
+    # One output buffer instead of a fresh Series per pandas operator.
+    e = e_hat_aligned.to_numpy(dtype=np.float64, copy=False)
+    lam = l_hat_aligned.to_numpy(dtype=np.float64, copy=False)
+    if e.size >= _FUSED_SCORE_MIN_LEN:
+        # Long backtest panels are memory-bound: the fused kernel reads
+        # both inputs and writes the output exactly once.
+        out = _score_core(e, lam, params.w1, params.w2)
+    else:
+        out = np.empty_like(e)
+        np.subtract(1.0, e, out=out)
+        out *= params.w1
+        out += params.w2 * (1.0 - lam)
+        np.clip(out, 0.0, 1.0, out=out)
+    return pd.Series(
+        out, index=e_hat_aligned.index, name=e_hat_aligned.name, copy=False
+    )
+
+
+@njit(cache=True)
+def _state_machine_core(
+    scores: np.ndarray,
+    tau_y: float,
+    tau_g: float,
+    k_up: int,
+    k_down: int,
+    min_flip_spacing: int,
+    prev_code: int,
+) -> np.ndarray:
+    """Hysteresis scan over a float64 score array returning int8 codes."""
+    n = scores.size
+    out = np.empty(n, np.int8)
+    current = prev_code
+    last_flip = -min_flip_spacing
+    up_count = 0
+    down_count = 0
+    for i in range(n):
+        score = scores[i]
+        # Branchless counter updates: the comparisons compile to setcc
+        # masks instead of data-dependent jumps. tau_y < tau_g, so at most
+        # one of the two conditions holds per score.
+        is_up = score >= tau_g
+        is_dn = score <= tau_y
+        up_count = (up_count + 1) * is_up
+        down_count = (down_count + 1) * is_dn
+
+        desired = (
+            1
+            + (up_count >= k_up)
+            - ((up_count < k_up) & (down_count >= k_down))
+        )
+
+        if desired != current and i - last_flip >= min_flip_spacing:
+            current = desired
+            last_flip = i
+            up_count = 0
+            down_count = 0
+
+        out[i] = current
+    return out
 
 
 def state_machine(
@@ -40,45 +120,22 @@ def state_machine(
     - require ``k_down`` consecutive <= ``tau_y`` to turn RED
     - otherwise YELLOW
     - throttle flips by ``min_flip_spacing`` observations.
+
+    The scan runs in a Numba kernel over int8 state codes and the result is
+    returned as a categorical Series backed by those codes: no per-row
+    string objects are materialised, and downstream ``== "GREEN"`` filters
+    compare codes instead of strings.
     """
     params = params or ScoreParams()
 
-    tau_y = params.tau_y
-    tau_g = params.tau_g
-    k_up = params.k_up
-    k_down = params.k_down
-    min_flip_spacing = params.min_flip_spacing
-
-    current_state = prev_state or "YELLOW"
-    last_flip_idx = -min_flip_spacing
-    up_count = 0
-    down_count = 0
-
-    states = []
-    for i, score in enumerate(scores):
-        if score >= tau_g:
-            up_count += 1
-            down_count = 0
-        elif score <= tau_y:
-            down_count += 1
-            up_count = 0
-        else:
-            up_count = 0
-            down_count = 0
-
-        desired_state = "YELLOW"
-        if up_count >= k_up:
-            desired_state = "GREEN"
-        elif down_count >= k_down:
-            desired_state = "RED"
-
-        spacing_ok = i - last_flip_idx >= min_flip_spacing
-        if desired_state != current_state and spacing_ok:
-            current_state = desired_state
-            last_flip_idx = i
-            up_count = 0
-            down_count = 0
-
-        states.append(current_state)
-
+    codes = _state_machine_core(
+        scores.to_numpy(dtype=np.float64),
+        params.tau_y,
+        params.tau_g,
+        params.k_up,
+        params.k_down,
+        params.min_flip_spacing,
+        _STATE_CODES[prev_state or "YELLOW"],
+    )
+    states = pd.Categorical.from_codes(codes, dtype=_STATE_DTYPE)
     return pd.Series(states, index=scores.index)
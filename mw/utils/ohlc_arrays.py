@@ -0,0 +1,73 @@
+"""Structure-of-arrays container for OHLC bars.
+
+Keeps the four price columns as plain contiguous ``np.ndarray`` fields so
+hot compute paths can run ufuncs and Numba kernels directly, with pandas
+only at the I/O boundaries.
+
+Exports:
+- OHLCArrays: dataclass of open/high/low/close arrays
+- validate_ohlc_arrays(bars: OHLCArrays) -> np.ndarray
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(slots=True)
+class OHLCArrays:
+    """OHLC columns as raw arrays, one field per column."""
+
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    timestamp: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "OHLCArrays":
+        """Build a container from a DataFrame without copying the columns."""
+
+        return cls(
+            open=df["open"].to_numpy(copy=False),
+            high=df["high"].to_numpy(copy=False),
+            low=df["low"].to_numpy(copy=False),
+            close=df["close"].to_numpy(copy=False),
+            timestamp=(
+                df.index.to_numpy(copy=False)
+                if isinstance(df.index, pd.DatetimeIndex)
+                else None
+            ),
+        )
+
+    def to_frame(self, index: Optional[pd.Index] = None) -> pd.DataFrame:
+        """Assemble the arrays back into a DataFrame, again without copies."""
+
+        if index is None and self.timestamp is not None:
+            index = pd.DatetimeIndex(self.timestamp)
+        return pd.DataFrame(
+            {
+                "open": self.open,
+                "high": self.high,
+                "low": self.low,
+                "close": self.close,
+            },
+            index=index,
+            copy=False,
+        )
+
+
+def validate_ohlc_arrays(bars: OHLCArrays) -> np.ndarray:
+    """Row validity of the OHLC relationship as a raw boolean array.
+
+    A row is valid when ``low <= min(open, close)`` and
+    ``max(open, close) <= high``; any NaN fails the row.
+    """
+
+    mn = np.minimum(bars.open, bars.close)
+    mx = np.maximum(bars.open, bars.close)
+    return (bars.low <= mn) & (mx <= bars.high)
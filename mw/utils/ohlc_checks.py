@@ -6,7 +6,64 @@ Exports:
 """
 from typing import Tuple, Union
 
+import numpy as np
 import pandas as pd
+from numba import njit
+
+from mw.utils.ohlc_arrays import OHLCArrays, validate_ohlc_arrays
+
+# Below this length the separate ufunc sweeps win; above it the fused
+# kernel traverses the four columns once instead of five times.
+_FUSED_MIN_LEN = 10_000
+
+
+@njit(cache=True)
+def _validate_clip_core(
+    o: np.ndarray, h: np.ndarray, low: np.ndarray, c: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Fused validity mask + high/low swap + open/close clip in one pass.
+
+    Matches the ufunc path exactly, including NaN propagation: a NaN in
+    any input fails the mask, and clipped values are NaN wherever
+    ``np.maximum``/``np.clip`` would produce one.
+    """
+    n = o.size
+    mask = np.empty(n, np.bool_)
+    co = np.empty_like(o)
+    ch = np.empty_like(h)
+    cl = np.empty_like(low)
+    cc = np.empty_like(c)
+    for i in range(n):
+        oo = o[i]
+        hh = h[i]
+        ll = low[i]
+        ci = c[i]
+
+        if oo != oo or hh != hh or ll != ll or ci != ci:
+            mask[i] = False
+        else:
+            mn = oo if oo <= ci else ci
+            mx = oo if oo >= ci else ci
+            mask[i] = ll <= mn and mx <= hh
+
+        if hh != hh or ll != ll:
+            hi = np.nan
+            lo = np.nan
+        else:
+            hi = hh if hh >= ll else ll
+            lo = ll if ll <= hh else hh
+        ch[i] = hi
+        cl[i] = lo
+
+        if oo != oo or lo != lo:
+            co[i] = np.nan
+        else:
+            co[i] = lo if oo < lo else (hi if oo > hi else oo)
+        if ci != ci or lo != lo:
+            cc[i] = np.nan
+        else:
+            cc[i] = lo if ci < lo else (hi if ci > hi else ci)
+    return mask, co, ch, cl, cc
 
 
 def validate_ohlc(
@@ -33,36 +90,66 @@ def validate_ohlc(
     pd.Series or tuple
         Boolean Series indexed like ``df`` where ``True`` indicates the row
         satisfies the OHLC relationship.  Additional return values depend on
-        ``return_flags`` and ``return_clipped``.
+        ``return_flags`` and ``return_clipped``; the flags frame carries the
+        four OHLC columns, while the clipped frame also keeps any extra
+        columns of ``df`` as zero-copy views.
     """
 
-    # Compute min/max between open and close for each row
-    oc = df[["open", "close"]]
-    min_val = oc.min(axis=1)
-    max_val = oc.max(axis=1)
-
-    # Validate the min/max values lie within the low/high bounds
-    mask = (df["low"] <= min_val) & (min_val <= max_val) & (max_val <= df["high"])
-
-    if not return_flags and not return_clipped:
-        return mask
-
-    # Prepare clipped values ensuring ``low <= high``
-    clipped = df.copy()
-    clipped_high = df[["high", "low"]].max(axis=1)
-    clipped_low = df[["high", "low"]].min(axis=1)
-    clipped["high"] = clipped_high
-    clipped["low"] = clipped_low
-    clipped["open"] = clipped["open"].clip(lower=clipped_low, upper=clipped_high)
-    clipped["close"] = clipped["close"].clip(lower=clipped_low, upper=clipped_high)
-
-    if return_flags and return_clipped:
-        flags = df != clipped
-        return mask, clipped, flags
-    if return_clipped:
-        return mask, clipped
+    # Work on the raw column buffers: np.minimum/np.maximum over two
+    # contiguous arrays avoids the intermediate two-column DataFrame and
+    # pandas' nan-aware axis=1 reducer.
+    bars = OHLCArrays.from_frame(df)
+    o = bars.open
+    h = bars.high
+    low = bars.low
+    c = bars.close
+
+    fused = (
+        (return_flags or return_clipped)
+        and o.size >= _FUSED_MIN_LEN
+        and all(
+            np.issubdtype(a.dtype, np.floating) for a in (o, h, low, c)
+        )
+    )
+
+    if fused:
+        # Large frames are memory-bound: one fused traversal replaces the
+        # five separate ufunc sweeps below.
+        mask_arr, co, ch, cl, cc = _validate_clip_core(o, h, low, c)
+        mask = pd.Series(mask_arr, index=df.index)
+    else:
+        mask = pd.Series(validate_ohlc_arrays(bars), index=df.index)
+
+        if not return_flags and not return_clipped:
+            return mask
+
+        # Prepare clipped values ensuring ``low <= high``
+        ch = np.maximum(h, low)
+        cl = np.minimum(h, low)
+        co = np.clip(o, cl, ch)
+        cc = np.clip(c, cl, ch)
+
+    # Non-OHLC columns ride along as zero-copy views; only the four price
+    # columns are replaced.
+    data = {"open": co, "high": ch, "low": cl, "close": cc}
+    for col in df.columns:
+        if col not in data:
+            data[col] = df[col].to_numpy(copy=False)
+    clipped = pd.DataFrame(data, index=df.index, copy=False)
+
     if return_flags:
-        flags = df != clipped
+        # Compare the raw arrays already in hand instead of re-reading the
+        # DataFrame through a pandas elementwise __ne__; NaN != NaN is True
+        # either way, so repaired-to-NaN cells flag identically.
+        flags = pd.DataFrame(
+            {"open": o != co, "high": h != ch, "low": low != cl, "close": c != cc},
+            index=df.index,
+            copy=False,
+        )
+        if return_clipped:
+            return mask, clipped, flags
         return mask, flags
+    if return_clipped:
+        return mask, clipped
 
     return mask
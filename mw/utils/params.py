@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PEParams:
     """Permutation entropy parameters."""
 
@@ -17,7 +18,7 @@ class PEParams:
     tau: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class FTLEParams:
     """Finite-time Lyapunov exponent parameters."""
 
@@ -28,14 +29,14 @@ class FTLEParams:
     theiler: int = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class SmoothingParams:
     """Smoothing configuration."""
 
     ema_span: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreParams:
     """Tradability scoring and state machine parameters."""
 
@@ -48,14 +49,14 @@ class ScoreParams:
     min_flip_spacing: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizationParams:
     """Normalisation parameters."""
 
     method: str = "minmax"
 
 
-@dataclass
+@dataclass(slots=True)
 class MinuteLoopParams:
     """Minute loop orchestration parameters."""
 
@@ -73,7 +74,7 @@ class MinuteLoopParams:
     freshness_stale_threshold: float = 180.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Params:
     """Structured configuration object for the application."""
 
@@ -92,35 +93,66 @@ class Params:
 _DEF_PATH = Path(__file__).resolve().parents[2] / "params" / "params_v1.json"
 
 
-def _merge(defaults: Any, data: Dict[str, Any]) -> Dict[str, Any]:
-    base = asdict(defaults)
-    for k, v in data.items():
-        if isinstance(v, dict) and isinstance(base.get(k), dict):
-            base[k].update(v)
-        else:
-            base[k] = v
-    return base
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    """Field names of a params dataclass, computed once per class."""
+    return frozenset(f.name for f in fields(cls))
+
+
+def _replace_fields(defaults: Any, data: Optional[Dict[str, Any]]) -> Any:
+    """Copy ``defaults`` with known fields overridden from ``data``.
+
+    ``dataclasses.replace`` performs a shallow field-by-field copy, so no
+    recursive ``asdict`` traversal or dict rebuild happens per load.
+    Unknown keys are silently dropped for backward compatibility.
+    """
+    if not data:
+        return replace(defaults)
+    known = _field_names(type(defaults))
+    return replace(
+        defaults, **{k: v for k, v in data.items() if k in known}
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _read_raw_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and JSON-parse a params file, memoized on path and mtime.
+
+    Keying on ``st_mtime_ns`` means repeated loads in the minute loop skip
+    the file read and parse while file edits still invalidate the entry.
+    The cached dict is only ever read by :func:`load_params`.
+    """
+    with open(path_str) as f:
+        return json.load(f)
 
 
 def load_params(path: Optional[Path] = None) -> Params:
-    """Load configuration from ``path`` into a :class:`Params` instance."""
-    path = path or _DEF_PATH
-    with Path(path).open() as f:
-        raw = json.load(f)
+    """Load configuration from ``path`` into a :class:`Params` instance.
+
+    The file read and JSON parse are cached per ``(path, mtime)``; every
+    call still returns a fresh :class:`Params`, so callers may mutate the
+    result without affecting later loads.
+    """
+    path = Path(path or _DEF_PATH)
+    raw = _read_raw_cached(str(path), path.stat().st_mtime_ns)
     defaults = Params()
+    # The offsets dict merges key-by-key rather than being replaced
+    # wholesale; copy the raw sub-dict first so the cached raw mapping is
+    # never mutated.
+    ml_data = dict(raw.get("minute_loop", {}))
+    ml_data["offsets"] = {
+        **defaults.minute_loop.offsets,
+        **ml_data.get("offsets", {}),
+    }
     return Params(
         granularity=raw.get("granularity", defaults.granularity),
         symbol=raw.get("symbol", defaults.symbol),
-        pe=PEParams(**_merge(defaults.pe, raw.get("pe", {}))),
-        ftle=FTLEParams(**_merge(defaults.ftle, raw.get("ftle", {}))),
-        smoothing=SmoothingParams(
-            **_merge(defaults.smoothing, raw.get("smoothing", {}))
-        ),
-        score=ScoreParams(**_merge(defaults.score, raw.get("score", {}))),
-        normalization=NormalizationParams(
-            **_merge(defaults.normalization, raw.get("normalization", {}))
-        ),
-        minute_loop=MinuteLoopParams(
-            **_merge(defaults.minute_loop, raw.get("minute_loop", {}))
+        pe=_replace_fields(defaults.pe, raw.get("pe")),
+        ftle=_replace_fields(defaults.ftle, raw.get("ftle")),
+        smoothing=_replace_fields(defaults.smoothing, raw.get("smoothing")),
+        score=_replace_fields(defaults.score, raw.get("score")),
+        normalization=_replace_fields(
+            defaults.normalization, raw.get("normalization")
         ),
+        minute_loop=_replace_fields(defaults.minute_loop, ml_data),
     )
@@ -2,10 +2,19 @@
 
 from datetime import datetime, timezone
 
+import pandas as pd
+
+_NS_PER_MINUTE = 60_000_000_000
+
+# Bound once at import: now_utc runs for every incoming tick, so the two
+# attribute lookups per call are worth skipping.
+_UTC = timezone.utc
+_now = datetime.now
+
 
 def now_utc() -> datetime:
     """Return the current time as an aware ``datetime`` in UTC."""
-    return datetime.now(timezone.utc)
+    return _now(_UTC)
 
 
 def floor_to_minute(dt: datetime) -> datetime:
@@ -14,4 +23,21 @@ def floor_to_minute(dt: datetime) -> datetime:
     The original timezone information is preserved.
     """
 
+    # Upstream minute bars usually arrive already aligned; returning the
+    # input unchanged skips the replace() allocation and tzinfo walk.
+    if dt.second == 0 and dt.microsecond == 0:
+        return dt
     return dt.replace(second=0, microsecond=0)
+
+
+def floor_index_to_minute(idx: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Floor every element of ``idx`` to the start of its minute.
+
+    One integer truncation over the epoch-nanosecond array replaces a
+    per-element ``floor_to_minute`` map, so whole-index callers never
+    cross the Python/C boundary per row.  Timezone and name are
+    preserved.
+    """
+
+    ns = idx.as_unit("ns").asi8 // _NS_PER_MINUTE * _NS_PER_MINUTE
+    return pd.DatetimeIndex(ns, tz=idx.tz, name=idx.name).as_unit(idx.unit)
@@ -5,8 +5,34 @@ Exports:
 - plot_diagnostics(e_hat, l_hat, score) -> figure
 """
 
+import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
+from numba import njit
+
+
+@njit(cache=True)
+def _runs(codes: np.ndarray):
+    """Start/end positions and codes of consecutive equal-code runs."""
+    n = codes.size
+    starts = np.empty(n, np.int64)
+    ends = np.empty(n, np.int64)
+    run_codes = np.empty(n, np.int64)
+    count = 0
+    if n:
+        start = 0
+        for i in range(1, n):
+            if codes[i] != codes[i - 1]:
+                starts[count] = start
+                ends[count] = i
+                run_codes[count] = codes[i - 1]
+                count += 1
+                start = i
+        starts[count] = start
+        ends[count] = n
+        run_codes[count] = codes[n - 1]
+        count += 1
+    return starts[:count], ends[:count], run_codes[:count]
 
 
 def plot_price_with_state(df: pd.DataFrame, state_series: pd.Series):
@@ -40,22 +66,23 @@ def plot_price_with_state(df: pd.DataFrame, state_series: pd.Series):
         "YELLOW": "#ffff00",
         "RED": "#ff0000",
     }
-    unique_states = pd.unique(states.dropna())
-    state_colors = {state: color_map[state] for state in unique_states}
-
-    # Group consecutive identical states and shade the corresponding regions
-    groups = (states != states.shift()).cumsum()
-    for _, g in states.groupby(groups):
-        state = g.iloc[0]
-        if pd.isna(state):
+    # Shade consecutive identical states: factorize once to integer codes
+    # (NaN becomes -1) and let the Numba scanner emit all run boundaries
+    # in a single integer pass — no groupby, no per-run get_indexer, and
+    # no elementwise comparison over a Python-object array.
+    codes, uniques = pd.factorize(states)
+    state_colors = {state: color_map[state] for state in uniques}
+    starts, ends, run_codes = _runs(codes)
+    idx = df.index
+    n = len(codes)
+    for start_pos, end_pos, code in zip(starts, ends, run_codes):
+        if code < 0:
             continue
-        start = g.index[0]
-        end = g.index[-1]
         # Extend the shading to the next index to avoid gaps
-        next_pos = df.index.get_indexer([end])[0] + 1
-        if next_pos < len(df.index):
-            end = df.index[next_pos]
-        ax.axvspan(start, end, color=state_colors[state], alpha=0.3)
+        end = idx[end_pos] if end_pos < n else idx[n - 1]
+        ax.axvspan(
+            idx[start_pos], end, color=state_colors[uniques[code]], alpha=0.3
+        )
 
     return fig
 
@@ -80,9 +107,14 @@ def plot_diagnostics(e_hat: pd.Series, l_hat: pd.Series, score: pd.Series):
 
     fig, axes = plt.subplots(3, 1, sharex=True)
 
-    axes[0].plot(e_hat)
-    axes[1].plot(l_hat)
-    axes[2].plot(score)
+    # Hand matplotlib raw ndarrays: plotting the Series objects routes
+    # through the pandas converter machinery, which rescans the index for
+    # unit conversion on every call.
+    x = e_hat.index.to_numpy()
+    for ax, series in zip(axes, (e_hat, l_hat, score)):
+        ax.plot(x if series is e_hat else series.index.to_numpy(), series.to_numpy())
+    if x.dtype.kind == "M":
+        axes[2].xaxis_date()
 
     axes[0].set_ylabel("e_hat")
     axes[1].set_ylabel("l_hat")
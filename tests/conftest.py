@@ -0,0 +1,64 @@
+"""Shared pytest configuration.
+
+Inserts the repository root on ``sys.path`` once at collection time so the
+individual test modules can import :mod:`mw` directly without repeating the
+``sys.path.append`` preamble (and its ``Path.resolve`` stat calls) per file.
+"""
+
+import pathlib
+import sys
+from datetime import datetime
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+
+matplotlib.use("Agg")
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def _close_figs():
+    """Close any figures a test left behind so they don't accumulate."""
+    yield
+    from matplotlib import pyplot as plt
+
+    plt.close("all")
+
+
+@pytest.fixture(scope="session")
+def random_series_1000():
+    """Seeded 1000-point Gaussian series shared across entropy tests."""
+    return pd.Series(np.random.default_rng(0).normal(size=1000))
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Install a deterministic ``now_utc`` in the minute loop.
+
+    Accepts either a single :class:`~datetime.datetime` (frozen clock) or
+    an iterable of datetimes consumed one reading per call, replacing the
+    per-test iterator + monkeypatch boilerplate.
+    """
+
+    def install(times):
+        if isinstance(times, datetime):
+            monkeypatch.setattr(
+                "mw.live.minute_loop.now_utc", lambda: times
+            )
+        else:
+            it = iter(times)
+            monkeypatch.setattr(
+                "mw.live.minute_loop.now_utc", lambda: next(it)
+            )
+
+    return install
+
+
+@pytest.fixture(scope="session")
+def sin_series_1000():
+    """1000-point sinusoid used as the deterministic entropy reference."""
+    return pd.Series(np.sin(np.linspace(0, 10 * np.pi, 1000)))
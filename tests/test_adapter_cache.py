@@ -0,0 +1,68 @@
+import pandas as pd
+import requests
+
+from mw.adapters import _cache, polygon_rest
+
+
+class DummyResponse:
+    def __init__(self, payload):
+        self.payload = payload
+        self.status_code = 200
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_file_cache_round_trip(tmp_path):
+    cache = _cache.FileCache(tmp_path)
+    df = pd.DataFrame({"a": [1.0, 2.0]})
+    key = _cache.cache_key("fn", "SYM", 0, 1, 10)
+
+    assert cache.get(key) is None
+    cache.put(key, df)
+    pd.testing.assert_frame_equal(cache.get(key), df)
+    # Zero max_age treats any existing entry as stale.
+    assert cache.get(key, max_age=0.0) is None
+
+
+def test_ttl_for_accepts_stringified_epochs():
+    # Requests layers often pass epoch params as strings; a closed
+    # historical window must cache forever in either form.
+    assert _cache.ttl_for(1_700_000_000_000_000_000, unit="ns") is None
+    assert _cache.ttl_for("1700000000000000000", unit="ns") is None
+    # A window ending today stays on the hourly TTL.
+    now_ns = pd.Timestamp.now(tz="UTC").value
+    assert _cache.ttl_for(str(now_ns), unit="ns") == 3600.0
+
+
+def test_fetch_fx_agg_minute_uses_cache(monkeypatch, tmp_path):
+    payload = {
+        "results": [
+            {"t": 0, "o": 1.0, "h": 1.5, "l": 0.5, "c": 1.2, "v": 10},
+        ]
+    }
+    calls = {"n": 0}
+
+    def fake_get(url, params, timeout):
+        calls["n"] += 1
+        return DummyResponse(payload)
+
+    monkeypatch.setenv("POLYGON_API_KEY", "KEY")
+    monkeypatch.setenv("MW_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    first = polygon_rest.fetch_fx_agg_minute(
+        "EURUSD", "2020-01-01", "2020-01-01"
+    )
+    second = polygon_rest.fetch_fx_agg_minute(
+        "EURUSD", "2020-01-01", "2020-01-01"
+    )
+
+    # The closed historical window is served from disk on the second call.
+    assert calls["n"] == 1
+    pd.testing.assert_frame_equal(second, first)
+    assert second.attrs["source_time_basis"] == "UTC"
@@ -1,13 +1,11 @@
 import json
-import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.io.canonicalizer import canonicalize  # noqa: E402
+from mw.io.canonicalizer import canonicalize
 
 
 def make_sample_df():
@@ -62,6 +60,9 @@ def test_canonicalize_end_to_end(tmp_path):
     expected["minute_of_day"] = expected["minute_of_day"].astype(
         result["minute_of_day"].dtype
     )
+    expected["quality_score"] = expected["quality_score"].astype(
+        result["quality_score"].dtype
+    )
 
     pd.testing.assert_frame_equal(result, expected)
 
@@ -130,6 +131,9 @@ def test_canonicalize_invalid_ohlc(tmp_path):
     expected["minute_of_day"] = expected["minute_of_day"].astype(
         result_df["minute_of_day"].dtype
     )
+    expected["quality_score"] = expected["quality_score"].astype(
+        result_df["quality_score"].dtype
+    )
     pd.testing.assert_frame_equal(result_df, expected)
 
     with Path(str(out) + ".meta.json").open() as f:
@@ -210,10 +214,18 @@ def test_et_to_utc_round_trip(tmp_path):
     assert canon.index[0].minute == 30
 
 
-def test_is_session_weekend(tmp_path):
+@pytest.mark.parametrize(
+    "date, session",
+    [
+        ("2024-01-05", True),  # Friday
+        ("2024-01-06", False),  # Saturday
+        ("2024-01-07", False),  # Sunday
+    ],
+)
+def test_is_session_weekend(tmp_path, date, session):
     raw = pd.DataFrame(
         {
-            "timestamp": ["2024-01-06 09:30"],  # Saturday
+            "timestamp": [f"{date} 09:30"],
             "open": [1.0],
             "high": [1.1],
             "low": [0.9],
@@ -228,19 +240,33 @@ def test_is_session_weekend(tmp_path):
 
     expected = pd.DataFrame(
         {
-            "timestamp": [pd.Timestamp("2024-01-06 14:30", tz="UTC")],
+            "timestamp": [pd.Timestamp(f"{date} 14:30", tz="UTC")],
             "open": [1.0],
             "high": [1.1],
             "low": [0.9],
             "close": [1.05],
             "is_gap": [False],
             "minute_of_day": [870],
-            "is_session": [False],
+            "is_session": [session],
             "quality_score": [1.0],
         }
     )
     expected["minute_of_day"] = expected["minute_of_day"].astype(
         result["minute_of_day"].dtype
     )
+    expected["quality_score"] = expected["quality_score"].astype(
+        result["quality_score"].dtype
+    )
 
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_canonicalize_float32_dtype(tmp_path):
+    raw = make_sample_df()
+    raw.attrs["source_time_basis"] = "America/New_York"
+    out = tmp_path / "f32.parquet"
+    result = canonicalize(raw, out.as_posix(), dtype="float32")
+
+    for col in ["open", "high", "low", "close"]:
+        assert result[col].dtype == np.float32
+    assert result.loc[~result["is_gap"], "open"].iloc[0] == np.float32(10.0)
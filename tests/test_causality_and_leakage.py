@@ -8,16 +8,12 @@ and no future information leaks into the live computations.
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-from mw.features.scaling import minmax_causal  # noqa: E402
-from mw.features.smoothing import ema  # noqa: E402
-from mw.scoring.tradability import score_tradability  # noqa: E402
+from mw.features.scaling import minmax_causal
+from mw.features.smoothing import ema
+from mw.scoring.tradability import score_tradability
 
 
 def _run_batch(df: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.Series]:
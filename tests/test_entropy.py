@@ -1,17 +1,15 @@
-# isort:skip_file
-import sys
-from pathlib import Path
+import math
 
 import numpy as np
 import pandas as pd
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-from mw.features.entropy import (  # noqa: E402
+from mw.features.entropy import (
     permutation_entropy,
     rolling_permutation_entropy,
+    rolling_sample_entropy,
     sample_entropy,
 )
-from mw.utils.params import Params  # noqa: E402
+from mw.utils.params import Params
 
 
 def test_monotonic_series_has_zero_entropy():
@@ -24,10 +22,8 @@ def test_constant_series_has_zero_entropy():
     assert permutation_entropy(series, m=3, tau=1) == 0.0
 
 
-def test_random_series_has_high_entropy():
-    rng = np.random.default_rng(0)
-    series = pd.Series(rng.normal(size=1000))
-    h = permutation_entropy(series, m=3, tau=1)
+def test_random_series_has_high_entropy(random_series_1000):
+    h = permutation_entropy(random_series_1000, m=3, tau=1)
     assert h > 0.95
 
 
@@ -42,11 +38,32 @@ def test_rolling_permutation_entropy_alignment():
         tau=params.pe.tau,
     )
 
-    expected = pd.Series([np.nan] * len(series))
-    for i in range(params.pe.window - 1, len(series)):
-        expected.iloc[i] = permutation_entropy(
-            series.iloc[i - params.pe.window + 1 : i + 1]  # noqa: E203
-        )
+    # Vectorized reference: encode every length-m ordinal pattern in one
+    # argsort batch, gather the patterns of each rolling window with a
+    # second stride view, and reduce the per-window histograms in a single
+    # np.add.at pass instead of calling permutation_entropy per window.
+    m, window = params.pe.m, params.pe.window
+    values = series.to_numpy(dtype=float)
+    ranks = np.argsort(
+        np.lib.stride_tricks.sliding_window_view(values, m),
+        axis=1,
+        kind="stable",
+    )
+    codes = ranks @ (m ** np.arange(m))
+    npat = window - m + 1
+    pat_windows = np.lib.stride_tricks.sliding_window_view(codes, npat)
+    counts = np.zeros((pat_windows.shape[0], m**m))
+    rows = np.repeat(np.arange(pat_windows.shape[0]), npat)
+    np.add.at(counts, (rows, pat_windows.ravel()), 1)
+    probs = counts / npat
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ent = -np.nansum(
+            np.where(probs > 0, probs * np.log(probs), 0.0), axis=1
+        ) / np.log(math.factorial(m))
+
+    expected_arr = np.full(len(series), np.nan)
+    expected_arr[window - 1 :] = ent  # noqa: E203
+    expected = pd.Series(expected_arr)
 
     pd.testing.assert_series_equal(result, expected)
 
@@ -56,12 +73,68 @@ def test_sample_entropy_constant_zero():
     assert sample_entropy(series, m=2, r=0.2) == 0.0
 
 
-def test_sample_entropy_random_greater_than_deterministic():
-    rng = np.random.default_rng(0)
-    random_series = pd.Series(rng.normal(size=1000))
-    deterministic = pd.Series(np.sin(np.linspace(0, 10 * np.pi, 1000)))
-    h_rand = sample_entropy(random_series, m=2, r=0.2)
-    h_det = sample_entropy(deterministic, m=2, r=0.2)
+def _sample_entropy_vectorized(series, m, r):
+    """Broadcast-based sample entropy reference.
+
+    Independent of the library's KD-tree counting: Chebyshev distances for
+    all template pairs come from one broadcasted ``max`` reduction and the
+    Theiler band is excluded by masking the upper-triangle indices.
+    """
+    x = series.dropna().to_numpy(dtype=float)
+    n = x.size
+    med = np.median(x)
+    tol = r * np.median(np.abs(x - med)) * 1.4826
+
+    def frac(emb):
+        nv = emb.shape[0]
+        dist = np.abs(emb[:, None, :] - emb[None, :, :]).max(axis=-1)
+        i, j = np.triu_indices(nv, k=m + 1)
+        matches = np.count_nonzero(dist[i, j] <= tol)
+        total = ((nv - m - 1) * (nv - m)) // 2
+        return matches / total
+
+    b = frac(np.lib.stride_tricks.sliding_window_view(x, m))
+    a = frac(np.lib.stride_tricks.sliding_window_view(x, m + 1))
+    return -np.log(a / b)
+
+
+def test_sample_entropy_matches_vectorized_reference(random_series_1000):
+    result = sample_entropy(random_series_1000, m=2, r=0.2)
+    reference = _sample_entropy_vectorized(random_series_1000, m=2, r=0.2)
+    assert np.isclose(result, reference)
+
+
+def test_rolling_sample_entropy_matches_per_window_calls():
+    rng = np.random.default_rng(3)
+    series = pd.Series(rng.normal(size=80))
+    window, m, r = 30, 2, 0.2
+    result = rolling_sample_entropy(series, window=window, m=m, r=r)
+
+    assert result.iloc[: window - 1].isna().all()
+    for end in range(window - 1, len(series)):
+        direct = sample_entropy(
+            series.iloc[end - window + 1 : end + 1], m=m, r=r  # noqa: E203
+        )
+        assert np.isclose(result.iloc[end], direct, equal_nan=True)
+
+
+def test_rolling_sample_entropy_nan_window_is_nan():
+    # A sine keeps every full window well matched, so NaN outputs can only
+    # come from the NaN-containing windows being skipped.
+    series = pd.Series(np.sin(np.linspace(0, 12 * np.pi, 80)))
+    series.iloc[60] = np.nan
+    result = rolling_sample_entropy(series, window=40, m=2, r=0.2)
+
+    assert result.iloc[:39].isna().all()
+    assert result.iloc[39:60].notna().all()
+    assert result.iloc[60:].isna().all()
+
+
+def test_sample_entropy_random_greater_than_deterministic(
+    random_series_1000, sin_series_1000
+):
+    h_rand = sample_entropy(random_series_1000, m=2, r=0.2)
+    h_det = sample_entropy(sin_series_1000, m=2, r=0.2)
     assert h_rand > h_det
 
 
@@ -1,28 +1,37 @@
-import sys
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
 import pytest
+from numba import njit
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from mw.features.ftle import ftle_rosenstein  # noqa: E402
-from mw.features.ftle import rolling_ftle_rosenstein  # noqa: E402
+from mw.features.ftle import ftle_rosenstein
+from mw.features.ftle import rolling_ftle_rosenstein
 
 
+@njit(cache=True)
 def logistic_map(r: float, x0: float, n: int) -> np.ndarray:
     x = np.empty(n)
     x[0] = x0
     for i in range(1, n):
-        x[i] = r * x[i - 1] * (1 - x[i - 1])
+        v = x[i - 1]
+        x[i] = r * v * (1.0 - v)
     return x
 
 
-def test_ftle_rosenstein_logistic_map():
-    data = logistic_map(4.0, 0.2, 500)
-    series = pd.Series(data)
-    val = ftle_rosenstein(series, window=200, m=2, tau=1, horizon=5, theiler=2)
+@pytest.fixture(scope="module")
+def logistic500():
+    return pd.Series(logistic_map(4.0, 0.2, 500))
+
+
+@pytest.fixture(scope="module")
+def logistic300():
+    return pd.Series(logistic_map(4.0, 0.2, 300))
+
+
+def test_ftle_rosenstein_logistic_map(logistic500):
+    val = ftle_rosenstein(
+        logistic500, window=200, m=2, tau=1, horizon=5, theiler=2
+    )
     assert val == pytest.approx(np.log(2), abs=0.2)
 
 
@@ -33,9 +42,10 @@ def test_ftle_rosenstein_logistic_map():
         (3, 2, 7, 3),
     ],
 )
-def test_rolling_matches_direct(m: int, tau: int, horizon: int, theiler: int):
-    data = logistic_map(4.0, 0.2, 300)
-    series = pd.Series(data)
+def test_rolling_matches_direct(
+    logistic300, m: int, tau: int, horizon: int, theiler: int
+):
+    series = logistic300
     window = 100
     rolling = rolling_ftle_rosenstein(
         series, window=window, m=m, tau=tau, horizon=horizon, theiler=theiler
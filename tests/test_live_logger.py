@@ -1,17 +1,14 @@
-import sys
-import csv
 import json
-from datetime import datetime, timezone
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pandas as pd
+from datetime import datetime, timezone
 
 from mw.live.logger import (
     DuplicateDrop,
     GapEvent,
     LateBar,
     SessionLogger,
-)  # noqa: E402
+)
 
 
 def test_session_logger_writes_csv_and_summary(tmp_path):
@@ -26,15 +23,13 @@ def test_session_logger_writes_csv_and_summary(tmp_path):
     logger.log_minute(ts2, -0.2, "RED", {"b": 2})
     logger.close(session="abc")
 
-    with csv_path.open() as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-    assert reader.fieldnames == ["timestamp", "score", "state", "diagnostics"]
-    assert rows[0]["timestamp"] == ts1.isoformat()
-    assert float(rows[0]["score"]) == 0.1
-    assert json.loads(rows[0]["diagnostics"]) == {"a": 1}
-    assert rows[1]["timestamp"] == ts2.isoformat()
-    assert rows[1]["state"] == "RED"
+    df = pd.read_csv(csv_path, converters={"diagnostics": json.loads})
+    assert list(df.columns) == ["timestamp", "score", "state", "diagnostics"]
+    assert df["timestamp"].iloc[0] == ts1.isoformat()
+    assert df["score"].iloc[0] == 0.1
+    assert df["diagnostics"].iloc[0] == {"a": 1}
+    assert df["timestamp"].iloc[1] == ts2.isoformat()
+    assert df["state"].iloc[1] == "RED"
 
     summary = json.loads(summary_path.read_text())
     assert summary["rows"] == 2
@@ -42,6 +37,29 @@ def test_session_logger_writes_csv_and_summary(tmp_path):
     assert summary["session"] == "abc"
 
 
+def test_session_logger_compiled_diagnostics_schema(tmp_path):
+    csv_path = tmp_path / "log.csv"
+    summary_path = tmp_path / "summary.json"
+    logger = SessionLogger(csv_path, summary_path)
+    logger.compile_diagnostics_schema(["e_hat", "l_hat"])
+
+    ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    logger.log_minute(ts, 0.5, "GREEN", {"e_hat": 0.25, "l_hat": 0.125})
+    # A dict outside the declared shape falls back to full encoding.
+    logger.log_minute(ts, 0.5, "GREEN", {"other": 1})
+    # Matching shape but non-numeric or non-finite values must also fall
+    # back: bare %s interpolation would emit invalid JSON for them.
+    logger.log_minute(ts, 0.5, "RED", {"e_hat": "RED", "l_hat": True})
+    logger.log_minute(ts, 0.5, "RED", {"e_hat": float("nan"), "l_hat": 0.5})
+    logger.close()
+
+    df = pd.read_csv(csv_path, converters={"diagnostics": json.loads})
+    assert df["diagnostics"].iloc[0] == {"e_hat": 0.25, "l_hat": 0.125}
+    assert df["diagnostics"].iloc[1] == {"other": 1}
+    assert df["diagnostics"].iloc[2] == {"e_hat": "RED", "l_hat": True}
+    assert df["diagnostics"].iloc[3] == {"e_hat": None, "l_hat": 0.5}
+
+
 def test_session_logger_records_gaps(tmp_path):
     csv_path = tmp_path / "log.csv"
     summary_path = tmp_path / "summary.json"
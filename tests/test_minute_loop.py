@@ -1,51 +1,39 @@
 import json
-import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
+from unittest import mock
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pandas as pd
 
-import pandas as pd  # noqa: E402
+from mw.live.logger import SessionLogger
+from mw.live.minute_loop import run_minute_loop
+from mw.utils.params import Params
 
-from mw.live.logger import SessionLogger  # noqa: E402
-from mw.live.minute_loop import run_minute_loop  # noqa: E402
-from mw.utils.params import Params  # noqa: E402
 
+def test_run_minute_loop_calls_functions_in_order(monkeypatch, fake_clock):
+    # One parent mock records the call order of every attached step, so
+    # the ordering assertion is a single list compare with no per-step
+    # closures.
+    steps = ["poll", "compute", "persist", "log", "plot", "health"]
+    parent = mock.Mock()
+    for name in steps:
+        parent.attach_mock(mock.Mock(return_value=None), name)
 
-def test_run_minute_loop_calls_functions_in_order(monkeypatch):
-    call_order = []
+    sleeps = []
 
-    def mk(name):
-        return lambda: call_order.append(name)
+    async def fake_sleep(x):
+        sleeps.append(x)
 
-    poll = mk("poll")
-    compute = mk("compute")
-    persist = mk("persist")
-    log = mk("log")
-    plot = mk("plot")
-    health = mk("health")
+    monkeypatch.setattr("asyncio.sleep", fake_sleep)
 
-    sleeps = []
-    monkeypatch.setattr("time.sleep", lambda x: sleeps.append(x))
-
-    start = datetime(2024, 1, 1, 0, 0, 2, tzinfo=timezone.utc)
-    times_iter = iter(
-        [
-            start,
-            start,
-            start + timedelta(seconds=2),
-            start + timedelta(seconds=5),
-            start + timedelta(seconds=6),
-            start + timedelta(seconds=7),
-            start + timedelta(seconds=8),
-            start + timedelta(seconds=9),
-        ]
-    )
+    # One monotonic reading to anchor the minute, then one per step.
+    mono_iter = iter([100.0, 100.0, 102.0, 105.0, 106.0, 107.0, 108.0, 109.0])
     monkeypatch.setattr(
-        "mw.live.minute_loop.now_utc",
-        lambda: next(times_iter),
+        "mw.live.minute_loop.monotonic",
+        lambda: next(mono_iter),
     )
 
+    fake_clock(datetime(2024, 1, 1, 0, 0, 2, tzinfo=timezone.utc))
+
     params = Params()
     params.minute_loop.offsets = {
         "poll": 3,
@@ -56,20 +44,21 @@ def test_run_minute_loop_calls_functions_in_order(monkeypatch):
         "health": 10,
     }
 
-    run_minute_loop(poll, compute, persist, log, plot, health, params)
+    run_minute_loop(
+        parent.poll,
+        parent.compute,
+        parent.persist,
+        parent.log,
+        parent.plot,
+        parent.health,
+        params,
+    )
 
-    assert call_order == [
-        "poll",
-        "compute",
-        "persist",
-        "log",
-        "plot",
-        "health",
-    ]
+    assert [name for name, _, _ in parent.mock_calls] == steps
     assert sleeps == [1.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0]
 
 
-def test_run_minute_loop_continues_after_failure(monkeypatch):
+def test_run_minute_loop_continues_after_failure(monkeypatch, fake_clock):
     call_order = []
 
     def poll():
@@ -92,8 +81,7 @@ def test_run_minute_loop_continues_after_failure(monkeypatch):
 
     monkeypatch.setattr("time.sleep", lambda x: None)
 
-    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr("mw.live.minute_loop.now_utc", lambda: start)
+    fake_clock(datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     params = Params()
     params.minute_loop.offsets = {}
@@ -103,7 +91,7 @@ def test_run_minute_loop_continues_after_failure(monkeypatch):
     assert call_order == ["compute", "persist", "log", "plot", "health"]
 
 
-def test_run_minute_loop_calls_error_fn(monkeypatch):
+def test_run_minute_loop_calls_error_fn(monkeypatch, fake_clock):
     errors = []
 
     def poll():
@@ -129,8 +117,7 @@ def test_run_minute_loop_calls_error_fn(monkeypatch):
 
     monkeypatch.setattr("time.sleep", lambda x: None)
 
-    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr("mw.live.minute_loop.now_utc", lambda: start)
+    fake_clock(datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     params = Params()
     params.minute_loop.offsets = {}
@@ -150,7 +137,9 @@ def test_run_minute_loop_calls_error_fn(monkeypatch):
     assert isinstance(errors[0][1], RuntimeError)
 
 
-def test_run_minute_loop_skips_remaining_on_critical_failure(monkeypatch):
+def test_run_minute_loop_skips_remaining_on_critical_failure(
+    monkeypatch, fake_clock
+):
     call_order = []
 
     def poll():
@@ -173,8 +162,7 @@ def test_run_minute_loop_skips_remaining_on_critical_failure(monkeypatch):
 
     monkeypatch.setattr("time.sleep", lambda x: None)
 
-    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr("mw.live.minute_loop.now_utc", lambda: start)
+    fake_clock(datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     params = Params()
     params.minute_loop.offsets = {}
@@ -185,7 +173,7 @@ def test_run_minute_loop_skips_remaining_on_critical_failure(monkeypatch):
     assert call_order == []
 
 
-def test_run_minute_loop_skips_compute_when_stale(monkeypatch):
+def test_run_minute_loop_skips_compute_when_stale(monkeypatch, fake_clock):
     call_order = []
 
     def poll():
@@ -211,8 +199,7 @@ def test_run_minute_loop_skips_compute_when_stale(monkeypatch):
 
     monkeypatch.setattr("time.sleep", lambda x: None)
 
-    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr("mw.live.minute_loop.now_utc", lambda: start)
+    fake_clock(datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     def last_bar_ts():
         return datetime.now(timezone.utc) - timedelta(seconds=1000)
@@ -236,7 +223,7 @@ def test_run_minute_loop_skips_compute_when_stale(monkeypatch):
     assert call_order == ["poll", "stale", "health"]
 
 
-def test_run_minute_loop_runs_all_when_fresh(monkeypatch):
+def test_run_minute_loop_runs_all_when_fresh(monkeypatch, fake_clock):
     call_order = []
 
     def poll():
@@ -262,8 +249,7 @@ def test_run_minute_loop_runs_all_when_fresh(monkeypatch):
 
     monkeypatch.setattr("time.sleep", lambda x: None)
 
-    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr("mw.live.minute_loop.now_utc", lambda: start)
+    fake_clock(datetime(2024, 1, 1, tzinfo=timezone.utc))
 
     def last_bar_ts():
         return datetime.now(timezone.utc)
@@ -296,9 +282,9 @@ def test_run_minute_loop_runs_all_when_fresh(monkeypatch):
 
 
 def test_minute_loop_logs_gaps_and_filters_duplicates(monkeypatch, tmp_path):
-    monkeypatch.chdir(tmp_path)
     from mw.live import minute_loop as ml
 
+    monkeypatch.setattr(ml, "_DATA_DIR", tmp_path / "data")
     ml._LAST_TS_SEEN = None
 
     monkeypatch.setattr("time.sleep", lambda x: None)
@@ -328,7 +314,9 @@ def test_minute_loop_logs_gaps_and_filters_duplicates(monkeypatch, tmp_path):
     params = Params()
     params.minute_loop.offsets = {}
 
-    logger = SessionLogger(Path("decisions.csv"), Path("summary.json"))
+    logger = SessionLogger(
+        tmp_path / "decisions.csv", tmp_path / "summary.json"
+    )
 
     for _ in range(3):
         run_minute_loop(
@@ -344,7 +332,7 @@ def test_minute_loop_logs_gaps_and_filters_duplicates(monkeypatch, tmp_path):
 
     logger.close()
 
-    path = Path("data") / "minute_bars.parquet"
+    path = tmp_path / "data" / "minute_bars.parquet"
     df = pd.read_parquet(path)
     assert list(df["timestamp"]) == [
         ts[0],
@@ -355,7 +343,7 @@ def test_minute_loop_logs_gaps_and_filters_duplicates(monkeypatch, tmp_path):
     assert logger.gap_count == 1
     assert logger.duplicate_count == 1
     assert logger.late_bar_count == 1
-    summary = json.loads(Path("summary.json").read_text())
+    summary = json.loads((tmp_path / "summary.json").read_text())
     health = summary["health"]
     assert health["seen_bars"] == 4
     assert health["gap_count"] == 1
@@ -364,9 +352,9 @@ def test_minute_loop_logs_gaps_and_filters_duplicates(monkeypatch, tmp_path):
 
 
 def test_minute_loop_duplicate_then_gap(monkeypatch, tmp_path):
-    monkeypatch.chdir(tmp_path)
     from mw.live import minute_loop as ml
 
+    monkeypatch.setattr(ml, "_DATA_DIR", tmp_path / "data")
     ml._LAST_TS_SEEN = None
     monkeypatch.setattr("time.sleep", lambda x: None)
 
@@ -385,7 +373,9 @@ def test_minute_loop_duplicate_then_gap(monkeypatch, tmp_path):
     params = Params()
     params.minute_loop.offsets = {}
 
-    logger = SessionLogger(Path("decisions.csv"), Path("summary.json"))
+    logger = SessionLogger(
+        tmp_path / "decisions.csv", tmp_path / "summary.json"
+    )
 
     for _ in range(2):
         run_minute_loop(
@@ -399,7 +389,7 @@ def test_minute_loop_duplicate_then_gap(monkeypatch, tmp_path):
             session_logger=logger,
         )
 
-    path = Path("data") / "minute_bars.parquet"
+    path = tmp_path / "data" / "minute_bars.parquet"
     df = pd.read_parquet(path)
     assert list(df["timestamp"]) == [ts[0], ts[1], ts[2]]
     assert logger.duplicate_count == 0
@@ -434,12 +424,12 @@ def test_minute_loop_duplicate_then_gap(monkeypatch, tmp_path):
     assert logger.gap_count == 1
 
 
-def test_run_minute_loop_advances_without_logger(monkeypatch):
+def test_run_minute_loop_advances_without_logger(monkeypatch, fake_clock):
     from mw.live import minute_loop as ml
 
     monkeypatch.setattr("time.sleep", lambda x: None)
     start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-    monkeypatch.setattr(ml, "now_utc", lambda: start)
+    fake_clock(start)
 
     ml._LAST_TS_SEEN = start
 
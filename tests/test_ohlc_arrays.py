@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from mw.utils.ohlc_arrays import OHLCArrays, validate_ohlc_arrays
+from mw.utils.ohlc_checks import validate_ohlc
+
+
+def test_from_frame_is_zero_copy_and_round_trips():
+    idx = pd.date_range("2024-01-01", periods=3, freq="1min", tz="UTC")
+    df = pd.DataFrame(
+        {
+            "open": [1.0, 2.0, 3.0],
+            "high": [2.0, 3.0, 4.0],
+            "low": [0.5, 1.5, 2.5],
+            "close": [1.5, 2.5, 3.5],
+        },
+        index=idx,
+    )
+
+    bars = OHLCArrays.from_frame(df)
+    assert np.shares_memory(bars.close, df["close"].to_numpy(copy=False))
+    pd.testing.assert_frame_equal(bars.to_frame(), df, check_freq=False)
+
+
+def test_validate_ohlc_arrays_matches_frame_validation():
+    df = pd.DataFrame(
+        {
+            "open": [1.0, 2.0, 1.5, np.nan],
+            "high": [2.5, 2.5, 1.8, 2.0],
+            "low": [0.5, 1.5, 1.0, 1.0],
+            "close": [2.0, 1.0, 2.0, 1.5],
+        }
+    )
+
+    result = validate_ohlc_arrays(OHLCArrays.from_frame(df))
+    expected = validate_ohlc(df)
+    assert np.array_equal(result, expected.to_numpy())
@@ -1,9 +1,6 @@
-from pathlib import Path
-import sys
-
+import numpy as np
 import pandas as pd
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pytest
 
 from mw.utils.ohlc_checks import validate_ohlc
 
@@ -52,3 +49,63 @@ def test_validate_ohlc_clip_and_flags():
     expected_flags = df != expected_clipped
     pd.testing.assert_frame_equal(flags, expected_flags)
 
+
+def test_validate_ohlc_preserves_float32_columns():
+    # float32 frames flow through without upcasting, so callers that hold
+    # prices at single precision keep the halved memory traffic.
+    df = pd.DataFrame(
+        {
+            "open": [1.0, 4.0],
+            "high": [3.0, 5.0],
+            "low": [2.0, 4.5],
+            "close": [2.5, 6.0],
+        },
+        dtype=np.float32,
+    )
+    mask, clipped = validate_ohlc(df, return_clipped=True)
+    assert mask.tolist() == [False, False]
+    assert (clipped.dtypes == np.float32).all()
+
+
+@pytest.mark.parametrize("n", [100, 10_000])
+def test_validate_ohlc_matches_vectorized_reference(n):
+    # Property-style check at scale: the mask must equal the two fused
+    # ufunc reductions over the raw float32 columns, keeping the
+    # implementation honest on its vectorized path.
+    rng = np.random.default_rng(n)
+    o, h, low, c = (
+        rng.normal(100, 5, n).astype(np.float32) for _ in range(4)
+    )
+    df = pd.DataFrame({"open": o, "high": h, "low": low, "close": c})
+    expected = (low <= np.minimum(o, c)) & (np.maximum(o, c) <= h)
+    np.testing.assert_array_equal(validate_ohlc(df).to_numpy(), expected)
+
+
+def test_validate_ohlc_fused_path_matches_small_path():
+    # Large frames take the fused Numba kernel; its output must match the
+    # ufunc path exactly, including NaN handling.
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame(
+        {
+            "open": rng.normal(100, 5, n),
+            "high": rng.normal(102, 5, n),
+            "low": rng.normal(98, 5, n),
+            "close": rng.normal(100, 5, n),
+        }
+    )
+    for col in df.columns:
+        df.loc[rng.integers(0, n, 50), col] = np.nan
+
+    mask, clipped, flags = validate_ohlc(
+        df, return_clipped=True, return_flags=True
+    )
+    head = df.head(100)
+    mask_s, clipped_s, flags_s = validate_ohlc(
+        head, return_clipped=True, return_flags=True
+    )
+
+    pd.testing.assert_series_equal(mask.head(100), mask_s)
+    pd.testing.assert_frame_equal(clipped.head(100), clipped_s)
+    pd.testing.assert_frame_equal(flags.head(100), flags_s)
+
@@ -1,12 +1,14 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.utils.params import Params, load_params  # noqa: E402
+from mw.utils.params import Params, load_params
 
 
 def test_default_params_match_json():
     params = Params()
     loaded = load_params()
     assert loaded == params
+
+
+def test_load_params_returns_independent_instances():
+    first = load_params()
+    first.minute_loop.offsets["poll"] = 99
+    second = load_params()
+    assert second.minute_loop.offsets["poll"] != 99
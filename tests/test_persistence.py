@@ -1,12 +1,13 @@
 import json
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import pandas as pd
 
-import pandas as pd  # noqa: E402
-
-from mw.utils.persistence import write_json, write_parquet  # noqa: E402
+from mw.utils.persistence import (
+    append_csv,
+    flush_csv,
+    write_json,
+    write_parquet,
+)
 
 
 def test_write_json_round_trip(tmp_path):
@@ -31,3 +32,19 @@ def test_write_parquet_round_trip(tmp_path):
     assert loaded.equals(df)
     # Ensure no temporary files remain
     assert {p.name for p in (tmp_path / "nested").iterdir()} == {target.name}
+
+
+def test_append_csv_header_and_rows(tmp_path):
+    import csv
+
+    target = tmp_path / "rows.csv"
+    append_csv({"a": 1, "b": "x,y"}, target, ["a", "b"])
+    append_csv({"a": 2, "b": "plain"}, target, ["a", "b"])
+    flush_csv()
+
+    with target.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {"a": "1", "b": "x,y"},
+        {"a": "2", "b": "plain"},
+    ]
@@ -1,43 +1,46 @@
 # isort:skip_file
-import csv
-import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 import pandas as pd
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-from mw.adapters import polygon_rest  # noqa: E402
-from mw.features.scaling import minmax_causal  # noqa: E402
-from mw.features.smoothing import ema  # noqa: E402
-from mw.io.canonicalizer import canonicalize  # noqa: E402
-from mw.live import minute_loop  # noqa: E402
-from mw.live.logger import SessionLogger  # noqa: E402
-from mw.scoring.tradability import (  # noqa: E402
+import pytest
+
+from mw.adapters import polygon_rest
+from mw.features.scaling import minmax_causal
+from mw.features.smoothing import ema
+from mw.io.canonicalizer import canonicalize
+from mw.live import minute_loop
+from mw.live.logger import SessionLogger
+from mw.scoring.tradability import (
     score_tradability,
     state_machine,
 )
-from mw.utils.params import Params  # noqa: E402
+from mw.utils.params import Params
+
+
+@pytest.fixture(scope="module")
+def raw_fake_fx():
+    """Canonical 8-row adapter frame, built (and tz-parsed) once per module."""
+    ts = pd.date_range("2024-01-01", periods=8, freq="1min", tz="UTC")
+    close = pd.Series([1, 1, 10, 11, 12, 1, 1, 1], index=ts)
+    df = pd.DataFrame(
+        {
+            "timestamp": ts,
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": [0] * len(close),
+        }
+    )
+    df.attrs["source_time_basis"] = "UTC"
+    return df
 
 
-def test_pipeline_integration(monkeypatch, tmp_path):
+def test_pipeline_integration(monkeypatch, tmp_path, raw_fake_fx):
     """End-to-end pipeline from adapter to state machine."""
 
     def fake_fetch(symbol, start, end, limit=50_000):
-        ts = pd.date_range("2024-01-01", periods=8, freq="1min", tz="UTC")
-        close = pd.Series([1, 1, 10, 11, 12, 1, 1, 1], index=ts)
-        df = pd.DataFrame(
-            {
-                "timestamp": ts,
-                "open": close,
-                "high": close,
-                "low": close,
-                "close": close,
-                "volume": [0] * len(close),
-            }
-        )
-        df.attrs["source_time_basis"] = "UTC"
-        return df
+        return raw_fake_fx.copy(deep=False)
 
     monkeypatch.setattr(polygon_rest, "fetch_fx_agg_minute", fake_fetch)
     raw = polygon_rest.fetch_fx_agg_minute(
@@ -67,13 +70,14 @@ def test_pipeline_integration(monkeypatch, tmp_path):
         index=canon.index,
     )
 
+    expected = expected.astype(states.dtype)
     pd.testing.assert_series_equal(states, expected)
 
 
-def test_live_pipeline_persists_outputs(monkeypatch, tmp_path):
+def test_live_pipeline_persists_outputs(monkeypatch, tmp_path, fake_clock):
     """Ensure compute results and decision logs are written to disk."""
 
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(minute_loop, "_DATA_DIR", tmp_path / "data")
 
     # Time control
     def gen():
@@ -82,8 +86,7 @@ def test_live_pipeline_persists_outputs(monkeypatch, tmp_path):
             yield t
             t += timedelta(seconds=1)
 
-    times = gen()
-    monkeypatch.setattr(minute_loop, "now_utc", lambda: next(times))
+    fake_clock(gen())
     monkeypatch.setattr("time.sleep", lambda x: None)
 
     df1 = pd.DataFrame({"x": [1]})
@@ -99,7 +102,9 @@ def test_live_pipeline_persists_outputs(monkeypatch, tmp_path):
     def persist():
         pass
 
-    logger = SessionLogger(Path("decisions.csv"), Path("summary.json"))
+    logger = SessionLogger(
+        tmp_path / "decisions.csv", tmp_path / "summary.json"
+    )
 
     def log():
         logger.log_minute(minute_loop.now_utc(), 0.1, "GREEN", {})
@@ -128,7 +133,5 @@ def test_live_pipeline_persists_outputs(monkeypatch, tmp_path):
     assert (tmp_path / "data" / "feat.parquet").exists()
     csv_path = tmp_path / "decisions.csv"
     assert csv_path.exists()
-    with csv_path.open() as f:
-        rows = list(csv.DictReader(f))
-    assert len(rows) == 2
+    assert len(pd.read_csv(csv_path)) == 2
     assert (tmp_path / "summary.json").exists()
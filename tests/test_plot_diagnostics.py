@@ -1,9 +1,5 @@
-import sys
-from pathlib import Path
-
 import pandas as pd
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from mw.viz.plots import plot_diagnostics
 
 
@@ -14,13 +10,10 @@ def test_plot_diagnostics_subplots_and_labels():
 
     fig = plot_diagnostics(e_hat, l_hat, score)
 
-    try:
-        assert len(fig.axes) == 3
-        assert fig.axes[0].get_ylabel() == "e_hat"
-        assert fig.axes[1].get_ylabel() == "l_hat"
-        assert fig.axes[2].get_ylabel() == "score"
-        assert fig.axes[2].get_xlabel() == "index"
-        assert fig.axes[0].get_shared_x_axes().joined(fig.axes[0], fig.axes[1])
-        assert fig.axes[0].get_shared_x_axes().joined(fig.axes[0], fig.axes[2])
-    finally:
-        fig.clf()
+    assert len(fig.axes) == 3
+    assert fig.axes[0].get_ylabel() == "e_hat"
+    assert fig.axes[1].get_ylabel() == "l_hat"
+    assert fig.axes[2].get_ylabel() == "score"
+    assert fig.axes[2].get_xlabel() == "index"
+    assert fig.axes[0].get_shared_x_axes().joined(fig.axes[0], fig.axes[1])
+    assert fig.axes[0].get_shared_x_axes().joined(fig.axes[0], fig.axes[2])
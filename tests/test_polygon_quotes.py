@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 import requests
@@ -73,8 +74,10 @@ def test_fetch_quotes_paginates(monkeypatch):
     assert calls[1][0] == expected_url
     assert calls[1][1] is None
 
-    expected_ts = pd.to_datetime([0, 1, 2, 3], unit="ns", utc=True)
-    assert df["ts_utc"].tolist() == list(expected_ts)
+    expected_ts = pd.DatetimeIndex(
+        np.arange(4, dtype="i8").view("M8[ns]")
+    ).tz_localize("UTC")
+    assert np.array_equal(df["ts_utc"].values, expected_ts.values)
     assert df["bid"].tolist() == [1.0, 1.1, 1.2, 1.3]
     assert df["ask"].tolist() == [2.0, 2.1, 2.2, 2.3]
     assert df["mid"].tolist() == pytest.approx([1.5, 1.6, 1.7, 1.8])
@@ -128,8 +131,10 @@ def test_fetch_quotes_three_pages(monkeypatch):
     assert calls[2][0] == expected_url3
     assert calls[2][1] is None
 
-    expected_ts = pd.to_datetime([0, 1, 2, 3, 4, 5], unit="ns", utc=True)
-    assert df["ts_utc"].tolist() == list(expected_ts)
+    expected_ts = pd.DatetimeIndex(
+        np.arange(6, dtype="i8").view("M8[ns]")
+    ).tz_localize("UTC")
+    assert np.array_equal(df["ts_utc"].values, expected_ts.values)
     assert df["bid"].tolist() == [1.0, 1.1, 1.2, 1.3, 1.4, 1.5]
     assert df["ask"].tolist() == [2.0, 2.1, 2.2, 2.3, 2.4, 2.5]
     assert df["mid"].tolist() == pytest.approx([1.5, 1.6, 1.7, 1.8, 1.9, 2.0])
@@ -166,8 +171,10 @@ def test_fetch_quotes_retries_on_429(monkeypatch):
 
     assert calls["n"] == 2
     assert sleeps == [4.0]
-    expected_ts = pd.to_datetime([0], unit="ns", utc=True)
-    assert df["ts_utc"].tolist() == list(expected_ts)
+    expected_ts = pd.DatetimeIndex(
+        np.arange(1, dtype="i8").view("M8[ns]")
+    ).tz_localize("UTC")
+    assert np.array_equal(df["ts_utc"].values, expected_ts.values)
     assert df["bid"].tolist() == [1.0]
     assert df["ask"].tolist() == [2.0]
     assert df["mid"].tolist() == [1.5]
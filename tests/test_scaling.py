@@ -1,15 +1,12 @@
-import sys
-from pathlib import Path
-
 import numpy as np
 import pandas as pd
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.features.scaling import (  # noqa: E402  # isort: skip
+from mw.features.scaling import (  # isort: skip
     minmax_causal,
+    tod_percentile_bands,
     tod_percentile_fit,
+    tod_percentile_index,
     tod_percentile_transform,
 )
 
@@ -69,3 +66,53 @@ def test_tod_percentile_transform_handles_missing_minutes():
 
     assert result.iloc[0] == pytest.approx(0.5)
     assert np.isnan(result.iloc[1])
+
+
+def test_tod_percentile_index_matches_plain_model():
+    """Indexed and plain model forms must score identically, NaNs included."""
+    rng = np.random.default_rng(7)
+    idx = pd.date_range("2024-01-01 09:30", periods=120, freq="1D")
+    fit_x = pd.Series(rng.normal(size=120), index=idx)
+    # Constant-valued bucket: every observation at 09:31 is identical.
+    const_idx = pd.date_range("2024-01-01 09:31", periods=20, freq="1D")
+    fit_x = pd.concat([fit_x, pd.Series(2.5, index=const_idx)])
+
+    model = tod_percentile_fit(fit_x)
+    indexed = tod_percentile_index(model)
+
+    query_idx = pd.DatetimeIndex(
+        [
+            "2024-06-01 09:30",  # interior value
+            "2024-06-01 09:30",  # below every stored value
+            "2024-06-01 09:30",  # NaN query
+            "2024-06-01 09:31",  # constant bucket, equal value
+            "2024-06-01 09:31",  # constant bucket, NaN query
+            "2024-06-01 10:00",  # minute absent from the model
+        ]
+    )
+    queries = pd.Series([0.1, -10.0, np.nan, 2.5, np.nan, 1.0], index=query_idx)
+
+    plain = tod_percentile_transform(queries, model)
+    fast = tod_percentile_transform(queries, indexed)
+    pd.testing.assert_series_equal(plain, fast)
+    assert np.isnan(plain.iloc[2]) and np.isnan(plain.iloc[4])
+
+
+def test_tod_percentile_bands_matches_transform():
+    idx = pd.date_range("2024-01-01 09:30", periods=40, freq="1D")
+    x = pd.Series(np.arange(40, dtype=float), index=idx)
+    model = tod_percentile_fit(x)
+    bands = tod_percentile_bands(x, model, qs=(0.5, 0.9))
+    scores = tod_percentile_transform(x, model)
+    assert list(bands.columns) == [0.5, 0.9]
+    assert (bands[0.5].to_numpy() == (scores.to_numpy() >= 0.5)).all()
+    assert (bands[0.9].to_numpy() == (scores.to_numpy() >= 0.9)).all()
+
+
+def test_tod_percentile_bands_missing_minute_is_false():
+    model = tod_percentile_fit(
+        pd.Series([1.0], index=pd.DatetimeIndex(["2024-01-01 09:30"]))
+    )
+    x = pd.Series([5.0], index=pd.DatetimeIndex(["2024-01-01 10:00"]))
+    bands = tod_percentile_bands(x, model)
+    assert not bands.to_numpy().any()
@@ -1,12 +1,13 @@
-import sys
-from pathlib import Path
-
 import pandas as pd
 import pandas.testing as pdt
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.features.second_order import curvature, tension, velocity  # noqa: E402  # isort: skip
+from mw.features.second_order import (  # isort: skip
+    curvature,
+    tension,
+    tension_np,
+    velocity,
+    velocity_curvature,
+)
 
 
 def test_velocity_and_curvature_compute_causal_differences():
@@ -32,3 +33,24 @@ def test_tension_combines_scaled_features():
     expected = pd.Series(0.6 * (1 - e_hat) - 0.4 * l_hat, index=idx)
 
     pdt.assert_series_equal(result, expected)
+
+
+def test_velocity_curvature_matches_separate_calls():
+    idx = pd.date_range("2024-01-01", periods=6, freq="D")
+    x = pd.Series([0.0, 1.0, 4.0, 9.0, 16.0, 25.0], index=idx, name="px")
+
+    v, c = velocity_curvature(x)
+
+    pdt.assert_series_equal(v, velocity(x))
+    pdt.assert_series_equal(c, curvature(x))
+    assert v.name == "px" and c.name == "px"
+
+
+def test_tension_np_matches_tension():
+    idx = pd.date_range("2024-01-01", periods=3, freq="D")
+    e_hat = pd.Series([0.2, 0.5, 0.8], index=idx)
+    l_hat = pd.Series([0.1, 0.2, 0.3], index=idx)
+
+    result = tension_np(e_hat, l_hat, alpha=0.6, beta=0.4)
+
+    pdt.assert_series_equal(result, tension(e_hat, l_hat, alpha=0.6, beta=0.4))
@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
-
 import pandas as pd
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.features.smoothing import ema  # noqa: E402  # isort: skip
+from mw.features.smoothing import ema  # isort: skip
 
 
 def manual_ema(series: pd.Series, span: int) -> pd.Series:
@@ -1,12 +1,13 @@
-import sys
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
+import pandas as pd
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from mw.utils.time import floor_to_minute, now_utc  # noqa: E402
+from mw.utils.time import (
+    floor_index_to_minute,
+    floor_to_minute,
+    now_utc,
+)
 
 
 def test_now_utc_timezone_and_proximity():
@@ -50,3 +51,19 @@ def test_floor_to_minute_preserves_timezone_and_floors(
     dt = dt_raw.replace(tzinfo=tz)
     expected = expected_raw.replace(tzinfo=tz)
     assert floor_to_minute(dt) == expected
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "America/New_York"])
+def test_floor_index_to_minute_matches_scalar(tz):
+    idx = pd.DatetimeIndex(
+        ["2024-01-01 12:34:56.789", "2024-01-01 23:59:59.999999"],
+        tz=tz,
+        name="ts",
+    )
+    result = floor_index_to_minute(idx)
+    expected = pd.DatetimeIndex(
+        [floor_to_minute(ts) for ts in idx], name="ts"
+    )
+    assert (result == expected).all()
+    assert result.tz == idx.tz
+    assert result.name == idx.name
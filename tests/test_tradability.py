@@ -1,16 +1,13 @@
 # isort: skip_file
-import sys
-from pathlib import Path
 
 import pandas as pd
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-from mw.scoring.tradability import (  # noqa: E402
+from mw.scoring.tradability import (
     score_tradability,
     state_machine,
 )
-from mw.utils.params import ScoreParams  # noqa: E402
+from mw.utils.params import ScoreParams
 
 
 def test_score_tradability_default_weights_align_and_clip():
@@ -53,6 +50,7 @@ def test_state_machine_hysteresis_and_spacing():
 
     result = state_machine(scores, params=ScoreParams())
 
+    expected = expected.astype(result.dtype)
     pd.testing.assert_series_equal(result, expected)
 
 